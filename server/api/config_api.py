@@ -12,9 +12,11 @@ Provider switching still uses RTVI since it requires frame injection into the pi
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Final, Literal
 
-from fastapi import APIRouter, Header, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from pydantic import BaseModel, Field
 
@@ -38,9 +40,16 @@ from utils.rate_limiter import (
 )
 
 if TYPE_CHECKING:
+    from main import AppServices
     from processors.client_manager import ClientConnectionManager
 
-config_router = APIRouter(prefix="/api", tags=["config"])
+# Responses are validated by the Pydantic response models and then encoded with orjson,
+# which avoids the stdlib json encoder on these small, frequently polled endpoints.
+config_router = APIRouter(
+    prefix="/api",
+    tags=["config"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # =============================================================================
@@ -144,17 +153,59 @@ class DefaultSectionsResponse(BaseModel):
     dictionary: str
 
 
+# =============================================================================
+# Prebuilt response bodies
+# =============================================================================
+
+JSON_MEDIA_TYPE: Final[str] = "application/json"
+
+# The default prompts are constants, so their response body is serialized once
+DEFAULT_SECTIONS_JSON: Final[bytes] = orjson.dumps(
+    DefaultSectionsResponse(
+        main=MAIN_PROMPT_DEFAULT,
+        advanced=ADVANCED_PROMPT_DEFAULT,
+        dictionary=DICTIONARY_PROMPT_DEFAULT,
+    ).model_dump()
+)
+
+NO_PROVIDERS_JSON: Final[bytes] = orjson.dumps(
+    AvailableProvidersResponse(stt=[], llm=[]).model_dump()
+)
+
+# The prompt sections update always reports the same setting and value
+PROMPT_SECTIONS_UPDATED_JSON: Final[bytes] = orjson.dumps(
+    ConfigSuccessResponse(setting="prompt-sections", value="custom").model_dump()
+)
+
+
 # =============================================================================
 # Helper functions
 # =============================================================================
 
 
+def get_app_services(request: Request) -> AppServices:
+    """Get the application services from app state."""
+    services: AppServices = request.app.state.services
+    return services
+
+
 def get_client_manager(request: Request) -> ClientConnectionManager:
     """Get the client manager from app state."""
-    from main import AppServices
+    return get_app_services(request).client_manager
 
-    services: AppServices = request.app.state.services
-    return services.client_manager
+
+def config_success_response(setting: str, value: bool | float) -> Response:
+    """Build a ConfigSuccessResponse body, encoded with orjson.
+
+    Args:
+        setting: The name of the updated setting
+        value: The new value of the setting
+
+    Returns:
+        JSON response with the ConfigSuccessResponse body
+    """
+    response = ConfigSuccessResponse(setting=setting, value=value)
+    return Response(content=orjson.dumps(response.model_dump()), media_type=JSON_MEDIA_TYPE)
 
 
 def build_provider_list(
@@ -190,17 +241,13 @@ def build_provider_list(
 
 @config_router.get("/prompt/sections/default", response_model=DefaultSectionsResponse)
 @limiter.limit(RATE_LIMIT_CONFIG, key_func=get_ip_only)
-async def get_default_sections(request: Request) -> DefaultSectionsResponse:
+async def get_default_sections(request: Request) -> Response:
     """Get default prompts for each section.
 
     Rate limited to prevent abuse, though this endpoint serves static data.
     """
     _ = request  # Required for rate limiter but unused in handler
-    return DefaultSectionsResponse(
-        main=MAIN_PROMPT_DEFAULT,
-        advanced=ADVANCED_PROMPT_DEFAULT,
-        dictionary=DICTIONARY_PROMPT_DEFAULT,
-    )
+    return Response(content=DEFAULT_SECTIONS_JSON, media_type=JSON_MEDIA_TYPE)
 
 
 @config_router.put(
@@ -216,7 +263,7 @@ async def update_prompt_sections(
     sections: CleanupPromptSections,
     request: Request,
     x_client_uuid: Annotated[str, Header()],
-) -> ConfigSuccessResponse:
+) -> Response:
     """Update the LLM formatting prompt sections for a connected client.
 
     Args:
@@ -261,7 +308,7 @@ async def update_prompt_sections(
     )
 
     logger.info(f"Updated prompt sections for client: {x_client_uuid}")
-    return ConfigSuccessResponse(setting="prompt-sections", value="custom")
+    return Response(content=PROMPT_SECTIONS_UPDATED_JSON, media_type=JSON_MEDIA_TYPE)
 
 
 @config_router.put(
@@ -276,7 +323,7 @@ async def update_llm_formatting(
     body: LLMFormattingRequest,
     request: Request,
     x_client_uuid: Annotated[str, Header()],
-) -> ConfigSuccessResponse:
+) -> Response:
     """Update the LLM formatting configuration for a connected client.
 
     Simple boolean:
@@ -312,7 +359,7 @@ async def update_llm_formatting(
     connection.llm_gate.set_llm_formatting_enabled(body.enabled)
 
     logger.info(f"Set LLM formatting enabled={body.enabled} for client: {x_client_uuid}")
-    return ConfigSuccessResponse(setting="llm-formatting", value=body.enabled)
+    return config_success_response("llm-formatting", body.enabled)
 
 
 @config_router.put(
@@ -328,7 +375,7 @@ async def update_stt_timeout(
     body: STTTimeoutRequest,
     request: Request,
     x_client_uuid: Annotated[str, Header()],
-) -> ConfigSuccessResponse:
+) -> Response:
     """Update the STT transcription timeout for a connected client.
 
     Args:
@@ -369,7 +416,7 @@ async def update_stt_timeout(
     connection.turn_controller.set_transcription_timeout(body.timeout_seconds)
 
     logger.info(f"Set STT timeout to {body.timeout_seconds}s for client: {x_client_uuid}")
-    return ConfigSuccessResponse(setting="stt-timeout", value=body.timeout_seconds)
+    return config_success_response("stt-timeout", body.timeout_seconds)
 
 
 @config_router.get(
@@ -377,7 +424,7 @@ async def update_stt_timeout(
     response_model=AvailableProvidersResponse,
 )
 @limiter.limit(RATE_LIMIT_PROVIDERS, key_func=get_ip_only)
-async def get_available_providers(request: Request) -> AvailableProvidersResponse:
+async def get_available_providers(request: Request) -> Response:
     """Get available STT and LLM providers.
 
     This endpoint is global (not per-client) because available providers are
@@ -385,7 +432,9 @@ async def get_available_providers(request: Request) -> AvailableProvidersRespons
     All clients see the same available providers.
 
     To get model information, we need an active connection. If no connections
-    exist, returns providers without model info.
+    exist, returns empty provider lists. Once a connection has built a service for
+    every configured provider, the serialized response is cached on AppServices and
+    reused; a partial response (a provider that failed to build) is never cached.
 
     Args:
         request: FastAPI request object
@@ -393,36 +442,55 @@ async def get_available_providers(request: Request) -> AvailableProvidersRespons
     Returns:
         Response containing lists of available STT and LLM providers
     """
-    client_manager = get_client_manager(request)
+    services = get_app_services(request)
+    if services.available_providers_json is not None:
+        return Response(content=services.available_providers_json, media_type=JSON_MEDIA_TYPE)
+
+    client_manager = services.client_manager
+    configured_stt_providers = set(services.available_stt_providers)
+    configured_llm_providers = set(services.available_llm_providers)
 
     # Try to get services from any active connection for model info
     # All connections have the same available providers (based on API keys)
     stt_services: dict[STTProviderId, Any] | None = None
     llm_services: dict[LLMProviderId, Any] | None = None
+    has_every_provider = False
 
-    # Get first active connection's services
+    # Service construction failures are only logged, so a connection can be missing a
+    # provider: prefer a connection that built all of them, else the first with services
     for uuid in list(client_manager._connections.keys()):
         conn = client_manager.get_connection(uuid)
-        if conn and conn.stt_services and conn.llm_services:
+        if not (conn and conn.stt_services and conn.llm_services):
+            continue
+        has_every_provider = (
+            conn.stt_services.keys() >= configured_stt_providers
+            and conn.llm_services.keys() >= configured_llm_providers
+        )
+        if has_every_provider or stt_services is None:
             stt_services = conn.stt_services
             llm_services = conn.llm_services
+        if has_every_provider:
             break
 
-    if stt_services and llm_services:
-        stt_providers = build_provider_list(
+    if not (stt_services and llm_services):
+        # No active connections - return empty lists
+        # Client should retry after connection is established
+        return Response(content=NO_PROVIDERS_JSON, media_type=JSON_MEDIA_TYPE)
+
+    response = AvailableProvidersResponse(
+        stt=build_provider_list(
             services=stt_services,
             labels=get_stt_provider_labels(),
             local_provider_ids={STTProviderId.WHISPER},
-        )
-        llm_providers = build_provider_list(
+        ),
+        llm=build_provider_list(
             services=llm_services,
             labels=get_llm_provider_labels(),
             local_provider_ids={LLMProviderId.OLLAMA},
-        )
-    else:
-        # No active connections - return empty lists
-        # Client should retry after connection is established
-        stt_providers = []
-        llm_providers = []
-
-    return AvailableProvidersResponse(stt=stt_providers, llm=llm_providers)
+        ),
+    )
+    available_providers_json = orjson.dumps(response.model_dump())
+    # Only a complete list is cached, so a later connection can fill in a missing provider
+    if has_every_provider:
+        services.available_providers_json = available_providers_json
+    return Response(content=available_providers_json, media_type=JSON_MEDIA_TYPE)
@@ -113,28 +113,26 @@ class Settings(BaseSettings):
         generate error messages with current provider names.
         """
         # Lazy import to avoid circular dependency (registry imports pipecat services)
+        from protocol.providers import LLM_PROVIDER_IDS_BY_VALUE, STT_PROVIDER_IDS_BY_VALUE
         from services.provider_registry import LLM_PROVIDERS, STT_PROVIDERS
 
-        # Check STT providers using registry's credential mappers
-        available_stt = [
-            config.display_name
-            for config in STT_PROVIDERS.values()
-            if config.credential_mapper.is_available(self)
-        ]
-        if not available_stt:
+        # Evaluate each credential mapper once; the auto provider checks below reuse these
+        stt_availability = {
+            provider_id: config.credential_mapper.is_available(self)
+            for provider_id, config in STT_PROVIDERS.items()
+        }
+        if not any(stt_availability.values()):
             all_stt_names = [config.display_name for config in STT_PROVIDERS.values()]
             raise ValueError(
                 f"No STT provider configured. "
                 f"Configure credentials for at least one of: {', '.join(all_stt_names)}"
             )
 
-        # Check LLM providers using registry's credential mappers
-        available_llm = [
-            config.display_name
-            for config in LLM_PROVIDERS.values()
-            if config.credential_mapper.is_available(self)
-        ]
-        if not available_llm:
+        llm_availability = {
+            provider_id: config.credential_mapper.is_available(self)
+            for provider_id, config in LLM_PROVIDERS.items()
+        }
+        if not any(llm_availability.values()):
             all_llm_names = [config.display_name for config in LLM_PROVIDERS.values()]
             raise ValueError(
                 f"No LLM provider configured. "
@@ -142,21 +140,17 @@ class Settings(BaseSettings):
             )
 
         # Validate auto providers have credentials configured
-        from services.provider_registry import LLMProviderId, STTProviderId
-
         if self.auto_stt_provider is not None:
             # Validate it's a known provider ID
-            try:
-                stt_provider_id = STTProviderId(self.auto_stt_provider)
-            except ValueError:
-                valid_ids = [p.value for p in STTProviderId]
+            stt_provider_id = STT_PROVIDER_IDS_BY_VALUE.get(self.auto_stt_provider)
+            if stt_provider_id is None:
                 raise ValueError(
                     f"Invalid AUTO_STT_PROVIDER: '{self.auto_stt_provider}'. "
-                    f"Must be one of: {', '.join(valid_ids)}"
-                ) from None
+                    f"Must be one of: {', '.join(STT_PROVIDER_IDS_BY_VALUE)}"
+                )
             # Validate credentials are available
             stt_config = STT_PROVIDERS.get(stt_provider_id)
-            if stt_config and not stt_config.credential_mapper.is_available(self):
+            if stt_config and not stt_availability[stt_provider_id]:
                 raise ValueError(
                     f"AUTO_STT_PROVIDER is set to '{self.auto_stt_provider}' but "
                     f"credentials for {stt_config.display_name} are not configured"
@@ -167,17 +161,15 @@ class Settings(BaseSettings):
 
         if self.auto_llm_provider is not None:
             # Validate it's a known provider ID
-            try:
-                llm_provider_id = LLMProviderId(self.auto_llm_provider)
-            except ValueError:
-                valid_ids = [p.value for p in LLMProviderId]
+            llm_provider_id = LLM_PROVIDER_IDS_BY_VALUE.get(self.auto_llm_provider)
+            if llm_provider_id is None:
                 raise ValueError(
                     f"Invalid AUTO_LLM_PROVIDER: '{self.auto_llm_provider}'. "
-                    f"Must be one of: {', '.join(valid_ids)}"
-                ) from None
+                    f"Must be one of: {', '.join(LLM_PROVIDER_IDS_BY_VALUE)}"
+                )
             # Validate credentials are available
             llm_config = LLM_PROVIDERS.get(llm_provider_id)
-            if llm_config and not llm_config.credential_mapper.is_available(self):
+            if llm_config and not llm_availability[llm_provider_id]:
                 raise ValueError(
                     f"AUTO_LLM_PROVIDER is set to '{self.auto_llm_provider}' but "
                     f"credentials for {llm_config.display_name} are not configured"
@@ -11,25 +11,30 @@ Usage:
 
 import asyncio
 import re
+import sys
 from collections.abc import Coroutine
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import Annotated, Final, cast
+from dataclasses import dataclass, field
+from typing import Annotated, Final
 
+import orjson
 import typer
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from loguru import logger
-from pipecat.audio.vad.silero import SileroVADAnalyzer, VADParams
+from onnxruntime import InferenceSession
+from pipecat.audio.vad.silero import VADParams
 from pipecat.frames.frames import HeartbeatFrame
+from pipecat.observers.base_observer import BaseObserver
 from pipecat.observers.loggers.user_bot_latency_log_observer import UserBotLatencyLogObserver
 from pipecat.pipeline.llm_switcher import LLMSwitcher
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.service_switcher import ServiceSwitcher, ServiceSwitcherStrategyManual
 from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIProcessor
 from pipecat.services.llm_service import LLMService
 from pipecat.services.stt_service import STTService
@@ -43,8 +48,9 @@ from pipecat.transports.smallwebrtc.request_handler import (
 from pipecat.transports.smallwebrtc.transport import SmallWebRTCTransport
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from uvicorn.config import HTTPProtocolType, LoopFactoryType
 
-from api.config_api import config_router
+from api.config_api import JSON_MEDIA_TYPE, config_router
 from config.settings import Settings
 from processors.client_manager import ClientConnectionManager
 from processors.configuration import ConfigurationHandler
@@ -67,8 +73,10 @@ from services.providers import (
     create_all_available_stt_services,
     get_available_llm_providers,
     get_available_stt_providers,
+    load_service_classes,
 )
-from utils.logger import configure_logging
+from services.vad import BufferedSileroVADAnalyzer, load_silero_vad_session
+from utils.logger import configure_logging, is_level_enabled
 from utils.observers import PipelineLogObserver
 from utils.rate_limiter import (
     RATE_LIMIT_HEALTH,
@@ -80,30 +88,47 @@ from utils.rate_limiter import (
     limiter,
 )
 
+# uvloop schedules the WebRTC, VAD and pipeline coroutines with less overhead than the
+# default asyncio loop. It is not available on Windows, so fall back to asyncio there.
+UVICORN_EVENT_LOOP: Final[LoopFactoryType] = "asyncio" if sys.platform == "win32" else "uvloop"
+
+# httptools parses HTTP in C instead of the pure-Python h11 parser uvicorn defaults to
+UVICORN_HTTP_PROTOCOL: Final[HTTPProtocolType] = "httptools"
+
+# Pipeline parameters are the same for every connection and never mutated by pipecat
+PIPELINE_PARAMS: Final[PipelineParams] = PipelineParams(
+    allow_interruptions=False,
+    enable_metrics=True,
+    enable_usage_metrics=True,
+    enable_heartbeats=True,
+)
+
+# Headers matching the CORSMiddleware configuration, added to error responses
+# by global_exception_handler
+CORS_ERROR_HEADERS: Final[dict[str, str]] = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
+
+# Orchestrators probe /health every few seconds and the body never changes
+HEALTH_OK_JSON: Final[bytes] = orjson.dumps({"status": "ok"})
+
 # ICE servers for WebRTC NAT traversal
 ICE_SERVERS: Final[list[IceServer]] = [
     IceServer(urls="stun:stun.l.google.com:19302"),
 ]
 
-# Pattern to match mDNS ICE candidates in SDP (e.g., "abc123-def4.local")
+# Hostname suffix of mDNS ICE candidates (e.g., "abc123-def4.local")
 # These candidates only work for local network peers and cause aioice state
 # issues when resolution fails on cloud deployments.
-MDNS_CANDIDATE_PATTERN: Final[re.Pattern[str]] = re.compile(
-    r"^a=candidate:.*\s[a-f0-9-]+\.local\s.*$",
-    re.MULTILINE | re.IGNORECASE,
+MDNS_HOSTNAME_SUFFIX: Final[str] = ".local"
+# mDNS hostnames are case-insensitive (RFC 6762); searched without copying the SDP
+MDNS_HOSTNAME_SUFFIX_PATTERN: Final[re.Pattern[str]] = re.compile(
+    re.escape(MDNS_HOSTNAME_SUFFIX), re.IGNORECASE
 )
 
-# Set to hold background tasks to prevent garbage collection before completion
-_background_tasks: set[asyncio.Task[None]] = set()
-
-
-def create_background_task(coroutine: Coroutine[object, object, None]) -> asyncio.Task[None]:
-    """Create a background task that won't be garbage collected before completion."""
-    task = asyncio.create_task(coroutine)
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
-    return task
-
 
 def filter_mdns_candidates_from_sdp(sdp: str) -> str:
     """Remove mDNS ICE candidates from SDP to prevent aioice resolution issues.
@@ -124,10 +149,16 @@ def filter_mdns_candidates_from_sdp(sdp: str) -> str:
     Returns:
         SDP with mDNS candidates removed
     """
-    filtered_sdp = MDNS_CANDIDATE_PATTERN.sub("", sdp)
-    # Clean up any resulting blank lines
-    filtered_sdp = re.sub(r"\n{3,}", "\n\n", filtered_sdp)
-    return filtered_sdp
+    # Most offers carry no mDNS candidates; one scan for the suffix is enough to skip the rewrite.
+    if MDNS_HOSTNAME_SUFFIX_PATTERN.search(sdp) is None:
+        return sdp
+
+    # One pass over the lines, dropping mDNS candidate lines along with their line endings
+    return "".join(
+        line
+        for line in sdp.splitlines(keepends=True)
+        if not (line.startswith("a=candidate:") and is_mdns_candidate(line))
+    )
 
 
 def is_mdns_candidate(candidate: str) -> bool:
@@ -143,10 +174,15 @@ def is_mdns_candidate(candidate: str) -> bool:
     Returns:
         True if this is an mDNS candidate, False otherwise
     """
-    return bool(re.search(r"\s[a-f0-9-]+\.local\s", candidate, re.IGNORECASE))
+    # mDNS hostnames are case-insensitive (RFC 6762), so lowercase the line once
+    lowered_candidate = candidate.lower()
+    if MDNS_HOSTNAME_SUFFIX not in lowered_candidate:
+        return False
+    # The address is a whitespace-separated field, so compare token suffixes directly
+    return any(token.endswith(MDNS_HOSTNAME_SUFFIX) for token in lowered_candidate.split())
 
 
-@dataclass
+@dataclass(slots=True)
 class AppServices:
     """Container for application services, stored on app.state.
 
@@ -154,8 +190,15 @@ class AppServices:
     to ensure complete isolation between concurrent clients. Each client
     gets fresh service instances with independent WebSocket connections.
 
-    The available_stt_providers and available_llm_providers lists are
-    pre-computed at startup since Settings is immutable after initialization.
+    The available_stt_providers and available_llm_providers lists, the
+    vad_params and the Silero vad_session are pre-computed at startup since
+    Settings is immutable after initialization.
+    For the same reason, available_providers_json is serialized once from the
+    first connection that built every configured provider and then reused by
+    GET /api/providers.
+
+    All server-wide mutable state lives here rather than in module globals, so
+    handlers reach it through a single slotted instance on app.state.
     """
 
     settings: Settings
@@ -164,6 +207,20 @@ class AppServices:
     client_manager: ClientConnectionManager
     available_stt_providers: list[STTProviderId]
     available_llm_providers: list[LLMProviderId]
+    vad_params: VADParams
+    vad_session: InferenceSession
+    available_providers_json: bytes | None = None
+    # Holds background tasks to prevent garbage collection before completion
+    background_tasks: set[asyncio.Task[None]] = field(default_factory=set)
+
+    def create_background_task(
+        self, coroutine: Coroutine[object, object, None]
+    ) -> asyncio.Task[None]:
+        """Create a background task that won't be garbage collected before completion."""
+        task = asyncio.create_task(coroutine)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
 
 
 async def run_pipeline(
@@ -190,25 +247,9 @@ async def run_pipeline(
 
     # Create transport using the WebRTC connection
     # (client connects with enableMic: false, only enables when recording starts)
-    # Build Silero VAD analyzer from environment-configurable settings (optional)
-    # Uses defaults from the library when settings are not provided.
-    settings = services.settings
-
-    # Construct VAD params from settings and always pass a VADParams object
-    vad_params_kwargs: dict = {}
-    if settings.vad_confidence is not None:
-        vad_params_kwargs["confidence"] = settings.vad_confidence
-    if settings.vad_start_secs is not None:
-        vad_params_kwargs["start_secs"] = settings.vad_start_secs
-    if settings.vad_stop_secs is not None:
-        vad_params_kwargs["stop_secs"] = settings.vad_stop_secs
-    if settings.vad_min_volume is not None:
-        vad_params_kwargs["min_volume"] = settings.vad_min_volume
-
-    vad_params = VADParams(**vad_params_kwargs)
-    vad_analyzer = SileroVADAnalyzer(params=vad_params)
-
-    logger.info(f"SileroVADAnalyzer configuration: params={vad_params_kwargs}")
+    vad_analyzer = BufferedSileroVADAnalyzer(
+        session=services.vad_session, params=services.vad_params
+    )
 
     transport = SmallWebRTCTransport(
         webrtc_connection=webrtc_connection,
@@ -220,10 +261,10 @@ async def run_pipeline(
     )
 
     # Create service switchers for this connection
-    from pipecat.pipeline.base_pipeline import FrameProcessor as PipecatFrameProcessor
-
-    stt_service_list = cast(list[PipecatFrameProcessor], list(stt_services.values()))
-    llm_service_list = list(llm_services.values())
+    # The switchers take (and keep) lists; annotating the element type they expect
+    # replaces the runtime cast() call
+    stt_service_list: list[FrameProcessor] = [*stt_services.values()]
+    llm_service_list: list[LLMService] = [*llm_services.values()]
 
     stt_switcher = ServiceSwitcher(
         services=stt_service_list,
@@ -250,21 +291,22 @@ async def run_pipeline(
         ]
     )
 
+    # Logging observers see every frame at every processor hop. Their most severe
+    # output is INFO (latency) and SUCCESS (pipeline start), so only attach them when
+    # that would be shown rather than running them to discard everything.
+    observers: list[BaseObserver] = []
+    if is_level_enabled("INFO"):
+        observers.append(UserBotLatencyLogObserver())
+    if is_level_enabled("SUCCESS"):
+        observers.append(PipelineLogObserver())
+
     # Create pipeline task - RTVI is automatically enabled and accessible via task.rtvi
     # This avoids duplicate RTVIObservers that caused text duplication in 0.0.101
     task = PipelineTask(
         pipeline,
-        params=PipelineParams(
-            allow_interruptions=False,
-            enable_metrics=True,
-            enable_usage_metrics=True,
-            enable_heartbeats=True,
-        ),
+        params=PIPELINE_PARAMS,
         idle_timeout_frames=(HeartbeatFrame,),
-        observers=[
-            UserBotLatencyLogObserver(),
-            PipelineLogObserver(),
-        ],
+        observers=observers,
     )
 
     # ConfigurationHandler processes provider switching messages from RTVI client
@@ -324,6 +366,31 @@ async def run_pipeline(
     await runner.run(task)
 
 
+def build_vad_params(settings: Settings) -> VADParams:
+    """Build Silero VAD parameters from environment-configurable settings.
+
+    Settings left unset fall back to the library defaults.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        VAD parameters shared by every connection's analyzer
+    """
+    vad_params_kwargs: dict = {}
+    if settings.vad_confidence is not None:
+        vad_params_kwargs["confidence"] = settings.vad_confidence
+    if settings.vad_start_secs is not None:
+        vad_params_kwargs["start_secs"] = settings.vad_start_secs
+    if settings.vad_stop_secs is not None:
+        vad_params_kwargs["stop_secs"] = settings.vad_stop_secs
+    if settings.vad_min_volume is not None:
+        vad_params_kwargs["min_volume"] = settings.vad_min_volume
+
+    logger.info(f"BufferedSileroVADAnalyzer configuration: params={vad_params_kwargs}")
+    return VADParams(**vad_params_kwargs)
+
+
 def initialize_services(settings: Settings) -> AppServices | None:
     """Initialize application services container.
 
@@ -351,6 +418,9 @@ def initialize_services(settings: Settings) -> AppServices | None:
     logger.info(f"Available STT providers: {[p.value for p in available_stt]}")
     logger.info(f"Available LLM providers: {[p.value for p in available_llm]}")
 
+    # Only the configured providers' SDKs are imported, and before any client connects
+    load_service_classes(available_stt, available_llm)
+
     return AppServices(
         settings=settings,
         webrtc_handler=SmallWebRTCRequestHandler(ice_servers=ICE_SERVERS),
@@ -358,6 +428,8 @@ def initialize_services(settings: Settings) -> AppServices | None:
         client_manager=ClientConnectionManager(),
         available_stt_providers=available_stt,
         available_llm_providers=available_llm,
+        vad_params=build_vad_params(settings),
+        vad_session=load_silero_vad_session(),
     )
 
 
@@ -376,33 +448,48 @@ async def lifespan(fastapi_app: FastAPI):  # noqa: ANN201
     # Cancel all active pipeline tasks for graceful shutdown
     if services.active_pipeline_tasks:
         logger.info(f"Cancelling {len(services.active_pipeline_tasks)} active pipeline tasks...")
-        for task in list(services.active_pipeline_tasks):
+        # Snapshot the tasks: done callbacks remove them from the set while we wait
+        pipeline_tasks = list(services.active_pipeline_tasks)
+        for task in pipeline_tasks:
             task.cancel()
         # Wait for all tasks to complete with timeout to avoid hanging
-        try:
-            async with asyncio.timeout(5.0):
-                await asyncio.gather(*services.active_pipeline_tasks, return_exceptions=True)
-            logger.info("All pipeline tasks cancelled")
-        except TimeoutError:
+        _, pending_tasks = await asyncio.wait(pipeline_tasks, timeout=5.0)
+        if pending_tasks:
             logger.warning("Timeout waiting for pipeline tasks to cancel")
+        else:
+            logger.info("All pipeline tasks cancelled")
 
     # SmallWebRTCRequestHandler manages all connections - close them cleanly
     await services.webrtc_handler.close()
     logger.success("All connections cleaned up")
 
 
-# Create FastAPI app
-app = FastAPI(title="Tambourine Server", lifespan=lifespan)
+# Create FastAPI app. The API is only consumed by the Tauri client, so the
+# interactive docs and OpenAPI schema routes are not served. Like the config
+# routes, responses are encoded with orjson.
+app = FastAPI(
+    title="Tambourine Server",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+)
 
 # Add rate limiter to app state
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
+# CORS is needed even on loopback: the Tauri webview origin (tauri://localhost)
+# differs from the server's. Let the webview cache preflight results for longer
+# than the 10 minute default so repeated config calls skip the OPTIONS round-trip
+# (browsers clamp this to their own maximum).
 app.add_middleware(
     CORSMiddleware,  # type: ignore[invalid-argument-type]
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=7200,
 )
 
 
@@ -410,17 +497,13 @@ app.add_middleware(
 # FastAPI's CORSMiddleware may not add headers to unhandled exception responses,
 # causing misleading "CORS errors".
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Ensure CORS headers are included even in error responses."""
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": str(exc)},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "*",
-            "Access-Control-Allow-Headers": "*",
-        },
+        headers=CORS_ERROR_HEADERS,
     )
 
 
@@ -430,9 +513,9 @@ app.include_router(config_router)
 
 @app.get("/health")
 @limiter.limit(RATE_LIMIT_HEALTH, key_func=get_ip_only)
-async def health_check(request: Request) -> dict[str, str]:
+async def health_check(request: Request) -> Response:
     """Health check endpoint for container orchestration (e.g., Lightsail)."""
-    return {"status": "ok"}
+    return Response(content=HEALTH_OK_JSON, media_type=JSON_MEDIA_TYPE)
 
 
 # =============================================================================
@@ -502,15 +585,19 @@ async def webrtc_offer(
     """
     services: AppServices = request.app.state.services
 
-    # Parse request body using from_dict to handle camelCase requestData field
-    # FastAPI's auto-parsing doesn't use the classmethod that handles the conversion
-    request_body = await request.json()
-    webrtc_request = SmallWebRTCRequest.from_dict(request_body)
+    # The body carries the full SDP offer, so decode it with orjson rather than stdlib json.
+    request_body = orjson.loads(await request.body())
 
-    # Extract client UUID from request_data
+    # Extract client UUID from the raw request data (camelCase requestData or snake_case
+    # request_data, like SmallWebRTCRequest.from_dict) so rejected offers never build a request
+    raw_request_data = (
+        request_body.get("request_data")
+        if "request_data" in request_body
+        else request_body.get("requestData")
+    )
     client_uuid: str | None = None
-    if webrtc_request.request_data:
-        client_uuid = webrtc_request.request_data.get("clientUUID")
+    if isinstance(raw_request_data, dict):
+        client_uuid = raw_request_data.get("clientUUID")
     logger.info(f"Incoming client UUID: {client_uuid}")
 
     # Require UUID - clients must register first
@@ -529,13 +616,17 @@ async def webrtc_offer(
             detail="Unregistered client UUID. Please register first.",
         )
 
+    # Parse request body using from_dict to handle camelCase requestData field
+    # FastAPI's auto-parsing doesn't use the classmethod that handles the conversion
+    webrtc_request = SmallWebRTCRequest.from_dict(request_body)
+
     # Handle existing connection with same UUID (one client = one connection)
     # 1. Synchronously remove old connection from tracking (frees UUID slot immediately)
     # 2. Clean up old connection in background (non-blocking)
     # This avoids the race condition where background cleanup accidentally kills new connection
     old_connection = services.client_manager.take_existing_connection(client_uuid)
     if old_connection:
-        create_background_task(services.client_manager.cleanup_connection(old_connection))
+        services.create_background_task(services.client_manager.cleanup_connection(old_connection))
     logger.info(f"Client connecting with UUID: {client_uuid}")
 
     # Filter mDNS candidates from SDP to prevent aioice resolution issues.
@@ -543,13 +634,8 @@ async def webrtc_offer(
     filtered_sdp = filter_mdns_candidates_from_sdp(webrtc_request.sdp)
     if filtered_sdp != webrtc_request.sdp:
         logger.info("Filtered mDNS candidates from SDP offer")
-        webrtc_request = SmallWebRTCRequest(
-            sdp=filtered_sdp,
-            type=webrtc_request.type,
-            pc_id=webrtc_request.pc_id,
-            restart_pc=webrtc_request.restart_pc,
-            request_data=webrtc_request.request_data,
-        )
+        # The request was built from this body above and is not shared, so update it in place
+        webrtc_request.sdp = filtered_sdp
 
     async def connection_callback(connection: SmallWebRTCConnection) -> None:
         """Callback invoked when connection is ready - spawns the pipeline."""
@@ -558,6 +644,8 @@ async def webrtc_offer(
         # connections to STT/LLM providers.
         # Uses pre-computed provider lists from AppServices to avoid redundant
         # iteration through all providers on every connection.
+        # Built on the event loop: some SDKs (e.g. Google's grpc.aio clients) bind to
+        # the running loop when constructed and fail in a worker thread.
         stt_services = create_all_available_stt_services(
             services.settings,
             services.available_stt_providers,
@@ -693,12 +781,22 @@ def main(
     logger.info("Press Ctrl+C to stop")
     logger.info("=" * 60)
 
-    # Run the server
+    # Run the server. Config API and WebRTC signaling share this single event loop.
+    # Access lines would be dropped at the "warning" level anyway, so skip building
+    # them, and skip the WebSocket protocol since audio arrives over WebRTC. The
+    # Tauri client doesn't read the Server header, so don't emit it; Date stays, since
+    # HTTP requires it from origin servers with a clock (RFC 9110, section 6.6.1).
     uvicorn.run(
         app,
         host=effective_host,
         port=effective_port,
+        loop=UVICORN_EVENT_LOOP,
+        http=UVICORN_HTTP_PROTOCOL,
+        ws="none",
+        interface="asgi3",
         log_level="warning",
+        access_log=False,
+        server_header=False,
     )
 
 
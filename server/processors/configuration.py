@@ -10,12 +10,18 @@ in api/config_api.py.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+import orjson
 from loguru import logger
 from pipecat.frames.frames import ManuallySwitchServiceFrame
-from pipecat.processors.frame_processor import FrameDirection
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIProcessor, RTVIServerMessageFrame
+from pydantic import BaseModel
 
 from protocol.messages import (
     ConfigErrorMessage,
@@ -26,6 +32,8 @@ from protocol.messages import (
     SettingName,
 )
 from protocol.providers import (
+    LLM_PROVIDER_IDS_BY_VALUE,
+    STT_PROVIDER_IDS_BY_VALUE,
     AutoProvider,
     KnownLLMProvider,
     KnownSTTProvider,
@@ -46,6 +54,54 @@ if TYPE_CHECKING:
     from config.settings import Settings
 
 
+# Serialized config-updated payloads keyed by (setting, selection type, provider ID).
+# Success is only sent for auto or available providers, so this stays small. The
+# cache holds immutable JSON bytes and every frame decodes its own dict from them, so
+# nothing downstream can change the payload another connection's frame will carry.
+_CONFIG_UPDATED_PAYLOADS: dict[tuple[SettingName, type[BaseModel], str | None], bytes] = {}
+
+
+def resolve_configured_provider_id[ProviderIdEnum: StrEnum](
+    configured_value: str | None,
+    provider_ids_by_value: Mapping[str, ProviderIdEnum],
+) -> ProviderIdEnum | None:
+    """Resolve a provider ID string from settings to its enum member.
+
+    Args:
+        configured_value: The raw provider ID from settings, if any
+        provider_ids_by_value: Lookup from raw provider ID strings to enum members
+
+    Returns:
+        The matching enum member, or None if unset or not a known provider ID
+    """
+    if configured_value is None:
+        return None
+    return provider_ids_by_value.get(configured_value)
+
+
+@dataclass(frozen=True)
+class ProviderSwitchTarget:
+    """Everything needed to switch one kind of provider (STT or LLM).
+
+    Attributes:
+        label: Provider kind used in log and error messages ("STT" or "LLM")
+        setting: Setting name echoed back to the client
+        switcher: Service switcher that receives ManuallySwitchServiceFrame
+        services_by_value: Available services keyed by raw provider ID string
+        provider_ids_by_value: All known provider IDs keyed by raw string
+        auto_provider: Raw auto provider ID from settings, if configured
+        auto_provider_id: The auto provider resolved to a known ID, if valid
+    """
+
+    label: str
+    setting: SettingName
+    switcher: ServiceSwitcher
+    services_by_value: Mapping[str, FrameProcessor]
+    provider_ids_by_value: Mapping[str, StrEnum]
+    auto_provider: str | None
+    auto_provider_id: StrEnum | None
+
+
 class ConfigurationHandler:
     """Handles provider switching via RTVI client messages.
 
@@ -82,11 +138,35 @@ class ConfigurationHandler:
             settings: Application settings for auto provider configuration
         """
         self._rtvi = rtvi_processor
-        self._stt_switcher = stt_switcher
-        self._llm_switcher = llm_switcher
-        self._stt_services = stt_services
-        self._llm_services = llm_services
-        self._settings = settings
+        # Settings are immutable, so "auto" selections are resolved once per connection.
+        # Services are keyed by raw provider ID string so a switch is a single lookup
+        # for any selection, and frozen like the rest of the target.
+        self._stt_switch_target = ProviderSwitchTarget(
+            label="STT",
+            setting=SettingName.STT_PROVIDER,
+            switcher=stt_switcher,
+            services_by_value=MappingProxyType(
+                {provider_id.value: service for provider_id, service in stt_services.items()}
+            ),
+            provider_ids_by_value=STT_PROVIDER_IDS_BY_VALUE,
+            auto_provider=settings.auto_stt_provider,
+            auto_provider_id=resolve_configured_provider_id(
+                settings.auto_stt_provider, STT_PROVIDER_IDS_BY_VALUE
+            ),
+        )
+        self._llm_switch_target = ProviderSwitchTarget(
+            label="LLM",
+            setting=SettingName.LLM_PROVIDER,
+            switcher=llm_switcher,
+            services_by_value=MappingProxyType(
+                {provider_id.value: service for provider_id, service in llm_services.items()}
+            ),
+            provider_ids_by_value=LLM_PROVIDER_IDS_BY_VALUE,
+            auto_provider=settings.auto_llm_provider,
+            auto_provider_id=resolve_configured_provider_id(
+                settings.auto_llm_provider, LLM_PROVIDER_IDS_BY_VALUE
+            ),
+        )
 
     async def handle_config_message(self, message: ConfigMessage) -> None:
         """Handle a typed configuration message.
@@ -108,48 +188,7 @@ class ConfigurationHandler:
         Args:
             selection: The provider selection (auto, known, or other)
         """
-        setting = SettingName.STT_PROVIDER
-
-        match selection:
-            case AutoProvider():
-                if self._settings.auto_stt_provider is None:
-                    logger.warning("No auto STT provider configured, no-op")
-                    await self._send_config_success(setting, selection)
-                    return
-                try:
-                    provider_id = STTProviderId(self._settings.auto_stt_provider)
-                except ValueError:
-                    await self._send_config_error(
-                        setting,
-                        f"Invalid auto STT provider configured: {self._settings.auto_stt_provider}",
-                    )
-                    return
-                logger.info(f"Auto mode for STT resolved to: {provider_id.value}")
-            case KnownSTTProvider(provider_id=provider_id):
-                pass  # Use directly
-            case OtherSTTProvider(provider_id=raw_id):
-                try:
-                    provider_id = STTProviderId(raw_id)
-                except ValueError:
-                    await self._send_config_error(setting, f"Unknown provider: {raw_id}")
-                    return
-
-        if provider_id not in self._stt_services:
-            await self._send_config_error(
-                setting,
-                f"Provider '{provider_id.value}' not available (no API key configured)",
-            )
-            return
-
-        service = self._stt_services[provider_id]
-        await self._stt_switcher.process_frame(
-            ManuallySwitchServiceFrame(service=service),
-            FrameDirection.DOWNSTREAM,
-        )
-
-        logger.success(f"Switched STT provider to: {provider_id.value}")
-        # Echo back the original selection - client sent it, server validated it works
-        await self._send_config_success(setting, selection)
+        await self._switch_provider(self._stt_switch_target, selection)
 
     async def _switch_llm_provider(self, selection: LLMProviderSelection) -> None:
         """Switch to a different LLM provider.
@@ -157,46 +196,68 @@ class ConfigurationHandler:
         Args:
             selection: The provider selection (auto, known, or other)
         """
-        setting = SettingName.LLM_PROVIDER
+        await self._switch_provider(self._llm_switch_target, selection)
+
+    async def _switch_provider(
+        self,
+        target: ProviderSwitchTarget,
+        selection: STTProviderSelection | LLMProviderSelection,
+    ) -> None:
+        """Resolve a provider selection and switch the target's service to it.
+
+        Args:
+            target: The STT or LLM services, switcher and auto configuration to use
+            selection: The provider selection (auto, known, or other)
+        """
+        setting = target.setting
 
         match selection:
             case AutoProvider():
-                if self._settings.auto_llm_provider is None:
-                    logger.warning("No auto LLM provider configured, no-op")
+                if target.auto_provider is None:
+                    logger.warning(f"No auto {target.label} provider configured, no-op")
                     await self._send_config_success(setting, selection)
                     return
-                try:
-                    provider_id = LLMProviderId(self._settings.auto_llm_provider)
-                except ValueError:
+                provider_id = target.auto_provider_id
+                if provider_id is None:
                     await self._send_config_error(
                         setting,
-                        f"Invalid auto LLM provider configured: {self._settings.auto_llm_provider}",
+                        f"Invalid auto {target.label} provider configured: {target.auto_provider}",
                     )
                     return
-                logger.info(f"Auto mode for LLM resolved to: {provider_id.value}")
-            case KnownLLMProvider(provider_id=provider_id):
-                pass  # Use directly
-            case OtherLLMProvider(provider_id=raw_id):
-                try:
-                    provider_id = LLMProviderId(raw_id)
-                except ValueError:
+                provider_value = provider_id.value
+                logger.info(f"Auto mode for {target.label} resolved to: {provider_value}")
+            case (
+                KnownSTTProvider(provider_id=provider_id)
+                | KnownLLMProvider(provider_id=provider_id)
+            ):
+                provider_value = provider_id.value
+            case OtherSTTProvider(provider_id=raw_id) | OtherLLMProvider(provider_id=raw_id):
+                if raw_id not in target.provider_ids_by_value:
                     await self._send_config_error(setting, f"Unknown provider: {raw_id}")
                     return
+                provider_value = raw_id
 
-        if provider_id not in self._llm_services:
+        service = target.services_by_value.get(provider_value)
+        if service is None:
             await self._send_config_error(
                 setting,
-                f"Provider '{provider_id.value}' not available (no API key configured)",
+                f"Provider '{provider_value}' not available (no API key configured)",
             )
             return
 
-        service = self._llm_services[provider_id]
-        await self._llm_switcher.process_frame(
+        # Clients re-send their selection on reconnect; switching to the active service
+        # would only re-run the switch handlers and re-request its metadata
+        if target.switcher.strategy.active_service is service:
+            logger.debug(f"{target.label} provider already active: {provider_value}")
+            await self._send_config_success(setting, selection)
+            return
+
+        await target.switcher.process_frame(
             ManuallySwitchServiceFrame(service=service),
             FrameDirection.DOWNSTREAM,
         )
 
-        logger.success(f"Switched LLM provider to: {provider_id.value}")
+        logger.success(f"Switched {target.label} provider to: {provider_value}")
         # Echo back the original selection - client sent it, server validated it works
         await self._send_config_success(setting, selection)
 
@@ -208,8 +269,14 @@ class ConfigurationHandler:
         The value is a selection type (AutoProvider or Known*Provider) that
         matches the format sent by the client, ensuring symmetric serialization.
         """
-        message = ConfigUpdatedMessage(setting=setting, value=value)
-        frame = RTVIServerMessageFrame(data=message.model_dump(by_alias=True))
+        provider_id = None if isinstance(value, AutoProvider) else str(value.provider_id)
+        payload_key = (setting, type(value), provider_id)
+        payload_json = _CONFIG_UPDATED_PAYLOADS.get(payload_key)
+        if payload_json is None:
+            message = ConfigUpdatedMessage(setting=setting, value=value)
+            payload_json = orjson.dumps(message.model_dump(by_alias=True))
+            _CONFIG_UPDATED_PAYLOADS[payload_key] = payload_json
+        frame = RTVIServerMessageFrame(data=orjson.loads(payload_json))
         await self._rtvi.push_frame(frame)
 
     async def _send_config_error(self, setting: SettingName, error: str) -> None:
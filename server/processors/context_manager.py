@@ -9,8 +9,7 @@ with the dictation-specific requirements:
 
 from __future__ import annotations
 
-import json
-import re
+from json.encoder import encode_basestring_ascii
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
@@ -33,12 +32,18 @@ if TYPE_CHECKING:
         LLMUserAggregator,
     )
 
-FOCUS_TEXT_CONTROL_CHARACTER_PATTERN = re.compile(r"[\x00-\x1F\x7F]")
-FOCUS_TEXT_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Maps ASCII control characters (0x00-0x1F, 0x7F) to spaces
+FOCUS_TEXT_CONTROL_CHARACTER_TRANSLATION = str.maketrans(
+    dict.fromkeys([*map(chr, range(0x20)), "\x7f"], " ")
+)
 
 MAX_FOCUS_TEXT_FIELD_LENGTH = 300
 MAX_FOCUS_ORIGIN_FIELD_LENGTH = 500
 
+# Raw snapshot values the active app context block is formatted from: application name,
+# window title, whether a browser tab is present, tab title and tab origin
+type FocusFields = tuple[str | None, str | None, bool, str | None, str | None]
+
 
 class SanitizedFocusText:
     """Value object for focus text that has already been sanitized.
@@ -67,12 +72,15 @@ class SanitizedFocusText:
         if raw_untrusted_text_value is None:
             return None
 
-        text_without_control_characters = FOCUS_TEXT_CONTROL_CHARACTER_PATTERN.sub(
-            " ", raw_untrusted_text_value
+        # Printable text has no control characters, which is the common case
+        text_without_control_characters = (
+            raw_untrusted_text_value
+            if raw_untrusted_text_value.isprintable()
+            else raw_untrusted_text_value.translate(FOCUS_TEXT_CONTROL_CHARACTER_TRANSLATION)
         )
-        text_with_normalized_whitespace = FOCUS_TEXT_WHITESPACE_PATTERN.sub(
-            " ", text_without_control_characters
-        ).strip()
+        # str.split() splits on the same Unicode whitespace as \s and drops the ends,
+        # collapsing and stripping in one pass
+        text_with_normalized_whitespace = " ".join(text_without_control_characters.split())
 
         if not text_with_normalized_whitespace:
             return None
@@ -92,7 +100,9 @@ class SanitizedFocusText:
         return self._sanitized_text_value
 
     def as_json_prompt_literal(self) -> str:
-        return json.dumps(self._sanitized_text_value, ensure_ascii=True)
+        # What json.dumps(value, ensure_ascii=True) ends up calling for a str, without
+        # the argument checks and encoder dispatch in front of it
+        return encode_basestring_ascii(self._sanitized_text_value)
 
 
 class DictationContextManager:
@@ -108,6 +118,20 @@ class DictationContextManager:
     emitted by TranscriptionBufferProcessor.
     """
 
+    __slots__ = (
+        "_active_app_context_block",
+        "_advanced_custom",
+        "_advanced_enabled",
+        "_aggregator_pair",
+        "_context",
+        "_dictionary_custom",
+        "_dictionary_enabled",
+        "_formatted_focus_block",
+        "_formatted_focus_fields",
+        "_main_custom",
+        "_system_prompt",
+    )
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the dictation context manager."""
         # Prompt section configuration (same structure as TranscriptionToLLMConverter)
@@ -116,10 +140,17 @@ class DictationContextManager:
         self._advanced_custom: str | None = None
         self._dictionary_enabled: bool = True
         self._dictionary_custom: str | None = None
+        # Combined prompt for the current sections, built on first use after a change
+        self._system_prompt: str | None = None
 
         # Create shared context (will be reset before each recording)
         self._context = LLMContext()
-        self._active_app_context: ActiveAppContextSnapshot | None = None
+        # Sanitized focus block for the latest snapshot, or None when there is nothing
+        # to inject. Formatted once per snapshot rather than again at recording start.
+        self._active_app_context_block: str | None = None
+        # Focus fields the last formatted block was built from, and that block
+        self._formatted_focus_fields: FocusFields | None = None
+        self._formatted_focus_block: str = ""
 
         # Create aggregator pair with external turn control
         # External strategies mean TranscriptionBufferProcessor controls when turns start/stop
@@ -135,13 +166,17 @@ class DictationContextManager:
     @property
     def system_prompt(self) -> str:
         """Get the combined system prompt from all sections."""
-        return combine_prompt_sections(
-            main_custom=self._main_custom,
-            advanced_enabled=self._advanced_enabled,
-            advanced_custom=self._advanced_custom,
-            dictionary_enabled=self._dictionary_enabled,
-            dictionary_custom=self._dictionary_custom,
-        )
+        system_prompt = self._system_prompt
+        if system_prompt is None:
+            system_prompt = combine_prompt_sections(
+                main_custom=self._main_custom,
+                advanced_enabled=self._advanced_enabled,
+                advanced_custom=self._advanced_custom,
+                dictionary_enabled=self._dictionary_enabled,
+                dictionary_custom=self._dictionary_custom,
+            )
+            self._system_prompt = system_prompt
+        return system_prompt
 
     def set_prompt_sections(
         self,
@@ -156,6 +191,11 @@ class DictationContextManager:
         The main section is always enabled. For each section, provide a custom
         prompt to override the default, or None to use the default.
 
+        Sections are only stored here and are combined into the system prompt when
+        the next recording starts, so a burst of updates costs a single combination.
+        The combined prompt is then reused by every recording until the sections change.
+        Updates identical to the current sections are ignored.
+
         Args:
             main_custom: Custom prompt for main section, or None for default.
             advanced_enabled: Whether the advanced section is enabled.
@@ -163,26 +203,56 @@ class DictationContextManager:
             dictionary_enabled: Whether the dictionary section is enabled.
             dictionary_custom: Custom prompt for dictionary section, or None for default.
         """
+        new_sections = (
+            main_custom,
+            advanced_enabled,
+            advanced_custom,
+            dictionary_enabled,
+            dictionary_custom,
+        )
+        current_sections = (
+            self._main_custom,
+            self._advanced_enabled,
+            self._advanced_custom,
+            self._dictionary_enabled,
+            self._dictionary_custom,
+        )
+        if new_sections == current_sections:
+            logger.debug("Formatting prompt sections unchanged")
+            return
+
         self._main_custom = main_custom
         self._advanced_enabled = advanced_enabled
         self._advanced_custom = advanced_custom
         self._dictionary_enabled = dictionary_enabled
         self._dictionary_custom = dictionary_custom
+        self._system_prompt = None
         logger.info("Formatting prompt sections updated")
 
     def set_active_app_context(self, active_app_context: ActiveAppContextSnapshot | None) -> None:
         """Store the latest active app context snapshot for prompt injection."""
-        self._active_app_context = active_app_context
         match active_app_context:
             case ActiveAppContextSnapshot() as latest_active_app_context:
-                sanitized_active_app_context_block = self._format_active_app_context_block(
-                    latest_active_app_context
+                # Snapshots arrive with every recording start, usually for the same window,
+                # so only re-format when a field that goes into the block changed
+                focus_fields = self._get_focus_fields(latest_active_app_context)
+                if focus_fields != self._formatted_focus_fields:
+                    self._formatted_focus_block = self._format_active_app_context_block(
+                        latest_active_app_context
+                    )
+                    self._formatted_focus_fields = focus_fields
+                sanitized_active_app_context_block = self._formatted_focus_block
+                self._active_app_context_block = (
+                    None
+                    if self._is_entire_active_app_context_unknown(latest_active_app_context)
+                    else sanitized_active_app_context_block
                 )
                 logger.info(
                     "Sanitized active app context for prompt injection:\n"
                     f"{sanitized_active_app_context_block}"
                 )
             case None:
+                self._active_app_context_block = None
                 logger.debug("Sanitized active app context for prompt injection: None")
 
     def _format_untrusted_focus_value(
@@ -197,8 +267,9 @@ class DictationContextManager:
             raw_focus_origin,
             max_field_length=MAX_FOCUS_ORIGIN_FIELD_LENGTH,
         )
-        if sanitized_focus_origin is None:
-            return None
+        # A scheme and a netloc can only both parse out of text containing "://"
+        if sanitized_focus_origin is None or "://" not in sanitized_focus_origin.value:
+            return sanitized_focus_origin
 
         parsed_focus_origin = urlparse(sanitized_focus_origin.value)
         if parsed_focus_origin.scheme and parsed_focus_origin.netloc:
@@ -210,6 +281,18 @@ class DictationContextManager:
 
         return sanitized_focus_origin
 
+    def _get_focus_fields(self, active_app_context: ActiveAppContextSnapshot) -> FocusFields:
+        focused_application = active_app_context.focused_application
+        focused_window = active_app_context.focused_window
+        focused_browser_tab = active_app_context.focused_browser_tab
+        return (
+            focused_application.display_name if focused_application else None,
+            focused_window.title if focused_window else None,
+            focused_browser_tab is not None,
+            focused_browser_tab.title if focused_browser_tab else None,
+            focused_browser_tab.origin if focused_browser_tab else None,
+        )
+
     def _is_entire_active_app_context_unknown(
         self, active_app_context: ActiveAppContextSnapshot
     ) -> bool:
@@ -291,15 +374,9 @@ class DictationContextManager:
             ChatCompletionSystemMessageParam(role="system", content=self.system_prompt),
         ]
 
-        match self._active_app_context:
-            case ActiveAppContextSnapshot() as latest_active_app_context:
-                if not self._is_entire_active_app_context_unknown(latest_active_app_context):
-                    focus_block = self._format_active_app_context_block(latest_active_app_context)
-                    messages.append(
-                        ChatCompletionSystemMessageParam(role="system", content=focus_block)
-                    )
-            case None:
-                pass
+        focus_block = self._active_app_context_block
+        if focus_block is not None:
+            messages.append(ChatCompletionSystemMessageParam(role="system", content=focus_block))
 
         self._context.set_messages(messages)
         logger.debug("Context reset for new recording")
@@ -6,6 +6,7 @@ This module contains the three-section prompt system:
 - Dictionary prompt: Personal word mappings and technical terms
 """
 
+from functools import lru_cache
 from typing import Final
 
 # Main prompt section - Core rules, punctuation, new lines
@@ -273,6 +274,9 @@ After each correction, verify that the replacement was applied accurately and th
 - Tauri"""
 
 
+# Each connection has its own context manager, so the combined prompt is rebuilt per
+# connection; the few distinct section sets in use are shared across them
+@lru_cache(maxsize=32)
 def combine_prompt_sections(
     main_custom: str | None,
     advanced_enabled: bool,
@@ -27,7 +27,7 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIServerMessageFrame
 
-from protocol.messages import EmptyTranscriptMessage, RawTranscriptionMessage
+from protocol.messages import EMPTY_TRANSCRIPT_MESSAGE_DATA, RawTranscriptionMessage
 from utils.logger import logger
 
 
@@ -104,7 +104,7 @@ class LLMGateFilter(FrameProcessor):
                         )
                     else:
                         await self.push_frame(
-                            RTVIServerMessageFrame(data=EmptyTranscriptMessage().model_dump()),
+                            RTVIServerMessageFrame(data=dict(EMPTY_TRANSCRIPT_MESSAGE_DATA)),
                             direction,
                         )
 
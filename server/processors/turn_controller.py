@@ -34,7 +34,7 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIServerMessageFrame
 
-from protocol.messages import EmptyTranscriptMessage
+from protocol.messages import EMPTY_TRANSCRIPT_MESSAGE_DATA
 from utils.logger import logger
 
 if TYPE_CHECKING:
@@ -49,21 +49,21 @@ DEFAULT_TRANSCRIPTION_WAIT_TIMEOUT_SECONDS: Final[float] = 0.5
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdleState:
     """Not recording. Waiting for start-recording message."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordingState:
     """Actively recording. Transcriptions pass through to aggregator."""
 
     has_content: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaitingForSTTState:
     """Stop-recording received, waiting for VAD to signal speech has stopped.
 
@@ -76,7 +76,7 @@ class WaitingForSTTState:
     direction: FrameDirection
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DrainingState:
     """Speech stopped, draining any remaining transcriptions from STT.
 
@@ -271,29 +271,34 @@ class TurnController(FrameProcessor):
         """Track that content arrived and signal draining if needed."""
         _ = direction  # Unused, kept for consistency with other handlers
 
+        # States are immutable, so only replace them on the first transcription; later
+        # ones in the same recording find has_content already set
         match self._state:
-            case RecordingState():
-                self._state = RecordingState(has_content=True)
-                logger.debug(f"Transcription received: '{frame.text}'")
+            case RecordingState(has_content=has_content):
+                if not has_content:
+                    self._state = RecordingState(has_content=True)
+                logger.debug("Transcription received: '{}'", frame.text)
 
-            case WaitingForSTTState() as state:
-                self._state = WaitingForSTTState(
-                    has_content=True,
-                    direction=state.direction,
-                )
-                logger.info(f"Transcription while waiting: '{frame.text}'")
+            case WaitingForSTTState(has_content=has_content) as state:
+                if not has_content:
+                    self._state = WaitingForSTTState(
+                        has_content=True,
+                        direction=state.direction,
+                    )
+                logger.info("Transcription while waiting: '{}'", frame.text)
 
-            case DrainingState() as state:
-                self._state = DrainingState(
-                    has_content=True,
-                    direction=state.direction,
-                )
+            case DrainingState(has_content=has_content) as state:
+                if not has_content:
+                    self._state = DrainingState(
+                        has_content=True,
+                        direction=state.direction,
+                    )
                 # Signal draining task to reset timeout
                 self._draining_event.set()
-                logger.info(f"Late transcription during draining: '{frame.text}'")
+                logger.info("Late transcription during draining: '{}'", frame.text)
 
             case IdleState():
-                logger.warning(f"Transcription while idle: '{frame.text}'")
+                logger.warning("Transcription while idle: '{}'", frame.text)
 
     # =========================================================================
     # Timeout Handler
@@ -391,5 +396,5 @@ class TurnController(FrameProcessor):
 
     async def _emit_empty_response(self, direction: FrameDirection) -> None:
         """Send an empty response message to the client."""
-        frame = RTVIServerMessageFrame(data=EmptyTranscriptMessage().model_dump())
+        frame = RTVIServerMessageFrame(data=dict(EMPTY_TRANSCRIPT_MESSAGE_DATA))
         await self.push_frame(frame, direction)
@@ -12,7 +12,8 @@ Message flow:
 
 from collections.abc import Mapping
 from enum import StrEnum
-from typing import Annotated, Literal
+from types import MappingProxyType
+from typing import Annotated, Final, Literal
 
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, RootModel, ValidationError, field_validator
@@ -257,6 +258,11 @@ def parse_rtvi_client_message_payload(raw_message: object) -> dict[str, object]
     return envelope.to_client_message_payload()
 
 
+# Parsed messages keyed by (type, data is None) for payloads without data. The parsed
+# messages are never mutated by their handlers, so one instance can be shared.
+_PARSED_DATALESS_CLIENT_MESSAGES: dict[tuple[str, bool], _ClientMessageUnion] = {}
+
+
 def parse_client_message(raw: Mapping[str, object]) -> _ClientMessageUnion | UnknownClientMessage:
     """Parse client message with forward compatibility.
 
@@ -264,15 +270,34 @@ def parse_client_message(raw: Mapping[str, object]) -> _ClientMessageUnion | Unk
     This allows exhaustive pattern matching while preserving raw data
     for debugging purposes.
     """
+    raw_message_type = raw.get("type")
+    raw_message_data = raw.get("data")
+    # Messages without data (stop-recording, start-recording without context) always
+    # parse to the same value, so reuse the first parse instead of validating again
+    dataless_cache_key = (
+        (raw_message_type, raw_message_data is None)
+        if isinstance(raw_message_type, str)
+        and (raw_message_data is None or raw_message_data == {})
+        else None
+    )
+    if dataless_cache_key is not None:
+        cached_message = _PARSED_DATALESS_CLIENT_MESSAGES.get(dataless_cache_key)
+        if cached_message is not None:
+            return cached_message
+
     try:
         wrapper = ClientMessage.model_validate(raw)
-        return wrapper.root  # Return the actual message, not the wrapper
     except ValidationError:
-        raw_message_type = raw.get("type")
         unknown_message_type = raw_message_type if isinstance(raw_message_type, str) else ""
         logger.debug(f"Unknown client message type: {unknown_message_type}")
         return UnknownClientMessage(type=unknown_message_type, raw=dict(raw))
 
+    message = wrapper.root  # Return the actual message, not the wrapper
+    # Only known types are cached, so the cache is bounded by the number of message types
+    if dataless_cache_key is not None:
+        _PARSED_DATALESS_CLIENT_MESSAGES[dataless_cache_key] = message
+    return message
+
 
 # =============================================================================
 # Server Messages
@@ -285,6 +310,14 @@ class EmptyTranscriptMessage(BaseModel):
     type: Literal["recording-complete-with-zero-words"] = "recording-complete-with-zero-words"
 
 
+# The zero-words notification never varies, so it is dumped once. The template is
+# read-only; frames take a dict() copy (the payload is flat), since transports need a
+# real dict to serialize and a shared one could be changed for every later frame.
+EMPTY_TRANSCRIPT_MESSAGE_DATA: Final[Mapping[str, object]] = MappingProxyType(
+    EmptyTranscriptMessage().model_dump()
+)
+
+
 class RawTranscriptionMessage(BaseModel):
     """Server message containing raw transcription (LLM bypassed).
 
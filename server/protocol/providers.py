@@ -14,7 +14,7 @@ and type-safe provider handling.
 """
 
 from enum import StrEnum
-from typing import Annotated, Literal
+from typing import Annotated, Final, Literal
 
 from pydantic import BaseModel, Field
 
@@ -52,6 +52,17 @@ class LLMProviderId(StrEnum):
     OPENROUTER = "openrouter"
 
 
+# Lookups from raw provider strings to enum members, so runtime validation is a
+# dict hit instead of an enum construction that raises ValueError on a miss
+STT_PROVIDER_IDS_BY_VALUE: Final[dict[str, STTProviderId]] = {
+    provider_id.value: provider_id for provider_id in STTProviderId
+}
+
+LLM_PROVIDER_IDS_BY_VALUE: Final[dict[str, LLMProviderId]] = {
+    provider_id.value: provider_id for provider_id in LLMProviderId
+}
+
+
 # =============================================================================
 # Provider Selection Types - Used for both input and config response output
 # =============================================================================
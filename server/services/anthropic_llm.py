@@ -0,0 +1,85 @@
+"""Anthropic LLM service that caches the dictation system prompt."""
+
+from collections.abc import Mapping
+from typing import Any, Final, cast
+
+from anthropic.types import CacheControlEphemeralParam, TextBlockParam
+from pipecat.adapters.services.anthropic_adapter import (
+    AnthropicLLMAdapter,
+    AnthropicLLMInvocationParams,
+)
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.services.anthropic.llm import AnthropicLLMService
+
+# Anthropic's short-lived (5 minute, refreshed on every hit) prompt cache
+EPHEMERAL_CACHE_CONTROL: Final[CacheControlEphemeralParam] = {"type": "ephemeral"}
+
+
+class CachedSystemPromptAnthropicLLMAdapter(AnthropicLLMAdapter):
+    """Anthropic adapter that marks the system prompt as a cacheable prefix.
+
+    Every dictation request starts with the same formatting prompt (a couple of
+    thousand tokens) followed by a short transcription, so the system prompt is
+    sent with a cache breakpoint. Requests after the first read it from Anthropic's
+    prompt cache, which is billed at a fraction of the input price and shortens
+    time to first token. pipecat's own enable_prompt_caching places breakpoints on
+    the latest user messages instead, which never repeat for single-turn dictation.
+    """
+
+    def get_llm_invocation_params(
+        self, context: LLMContext, enable_prompt_caching: bool
+    ) -> AnthropicLLMInvocationParams:
+        """Get Anthropic invocation parameters with a cache breakpoint on the system prompt.
+
+        Args:
+            context: The LLM context containing messages, tools, etc.
+            enable_prompt_caching: Whether pipecat's message prompt caching is enabled.
+
+        Returns:
+            Invocation parameters whose system prompt, if any, ends in a cache breakpoint
+        """
+        params = super().get_llm_invocation_params(
+            context, enable_prompt_caching=enable_prompt_caching
+        )
+        system_blocks = get_cached_system_blocks(params["system"])
+        if system_blocks is not None:
+            # AnthropicLLMInvocationParams types system as a plain string, but the
+            # Messages API also takes text blocks, which is where cache_control goes
+            params["system"] = cast(Any, system_blocks)
+        return params
+
+
+class CachedSystemPromptAnthropicLLMService(AnthropicLLMService):
+    """Anthropic LLM service whose adapter caches the dictation system prompt.
+
+    Both streamed completions and run_inference() get their parameters from the
+    adapter, so the breakpoint is added on every request path.
+    """
+
+    adapter_class = CachedSystemPromptAnthropicLLMAdapter
+
+
+def get_cached_system_blocks(system: object) -> list[TextBlockParam] | None:
+    """Build the system prompt as text blocks ending in a cache breakpoint.
+
+    Args:
+        system: System prompt from the adapter: a string, text blocks, or NOT_GIVEN
+
+    Returns:
+        System text blocks with cache_control on the last one, or None to leave the
+        system prompt unchanged (no prompt, or one that is not text)
+    """
+    match system:
+        case str() if system:
+            return [{"type": "text", "text": system, "cache_control": EPHEMERAL_CACHE_CONTROL}]
+        case list() as blocks if (
+            blocks
+            and all(isinstance(block, Mapping) for block in blocks)
+            and blocks[-1].get("type") == "text"
+        ):
+            # Copy so the breakpoint never leaks into the blocks the adapter was given
+            system_blocks = [cast(TextBlockParam, dict(block)) for block in blocks]
+            system_blocks[-1]["cache_control"] = EPHEMERAL_CACHE_CONTROL
+            return system_blocks
+        case _:
+            return None
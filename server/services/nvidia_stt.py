@@ -295,6 +295,11 @@ class NVidiaWebSocketSTTService(WebsocketSTTService):
             self._websocket = await websockets.connect(
                 self._url,
                 open_timeout=60.0,  # Allow time for model loading on first connection
+                # Raw PCM barely compresses, so permessage-deflate only costs CPU
+                compression=None,
+                # The default 32 KiB is about one second of audio; let short server
+                # stalls buffer instead of blocking every send() on drain
+                write_limit=2**20,
             )
             self._ready = False
 
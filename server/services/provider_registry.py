@@ -1,44 +1,25 @@
 """Provider registry for STT and LLM services.
 
-This module defines the available providers using direct class imports for
-compile-time type safety. If pipecat changes class names, we get import errors
-at startup instead of runtime failures.
+This module defines the available providers. Each provider's pipecat service
+class is imported by a small loader function, so the (often heavy) SDKs of
+providers that are not configured are never imported. The loaders still use
+direct imports for static type checking, and the server loads the classes of
+all configured providers at startup, so import errors surface before serving.
 
 Provider ID enums are defined in protocol.providers (single source of truth).
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final
 
-# Direct imports from pipecat - type checked at import time
-from pipecat.services.anthropic.llm import AnthropicLLMService
-from pipecat.services.assemblyai.stt import AssemblyAISTTService
-from pipecat.services.aws.llm import AWSBedrockLLMService
-from pipecat.services.aws.stt import AWSTranscribeSTTService
-from pipecat.services.azure.stt import AzureSTTService
-from pipecat.services.cartesia.stt import CartesiaSTTService
-from pipecat.services.cerebras.llm import CerebrasLLMService
-from pipecat.services.deepgram.stt import DeepgramSTTService
-from pipecat.services.google.llm import GoogleLLMService
-from pipecat.services.google.stt import GoogleSTTService
-from pipecat.services.groq.llm import GroqLLMService
-from pipecat.services.groq.stt import GroqSTTService
 from pipecat.services.llm_service import LLMService
-from pipecat.services.ollama.llm import OLLamaLLMService
-from pipecat.services.openai.llm import OpenAILLMService
-from pipecat.services.openai.stt import OpenAISTTService
-from pipecat.services.openrouter.llm import OpenRouterLLMService
-from pipecat.services.speechmatics.stt import SpeechmaticsSTTService
 from pipecat.services.stt_service import STTService
-from pipecat.services.whisper.stt import WhisperSTTService
 
 # Provider ID enums from protocol (single source of truth)
 from protocol.providers import LLMProviderId, STTProviderId
 
-# Custom service for Nemotron ASR
-from services.nvidia_stt import NVidiaWebSocketSTTService
-
 if TYPE_CHECKING:
     from config.settings import Settings
 
@@ -149,6 +130,139 @@ class NoAuthMapper(CredentialMapper):
         return result
 
 
+# =============================================================================
+# Service Class Loaders - Import each provider's service class on demand
+# =============================================================================
+
+
+def _load_speechmatics_stt() -> type[STTService]:
+    from pipecat.services.speechmatics.stt import SpeechmaticsSTTService
+
+    return SpeechmaticsSTTService
+
+
+def _load_assemblyai_stt() -> type[STTService]:
+    from pipecat.services.assemblyai.stt import AssemblyAISTTService
+
+    return AssemblyAISTTService
+
+
+def _load_aws_stt() -> type[STTService]:
+    from pipecat.services.aws.stt import AWSTranscribeSTTService
+
+    return AWSTranscribeSTTService
+
+
+def _load_azure_stt() -> type[STTService]:
+    from pipecat.services.azure.stt import AzureSTTService
+
+    return AzureSTTService
+
+
+def _load_cartesia_stt() -> type[STTService]:
+    from pipecat.services.cartesia.stt import CartesiaSTTService
+
+    return CartesiaSTTService
+
+
+def _load_deepgram_stt() -> type[STTService]:
+    from pipecat.services.deepgram.stt import DeepgramSTTService
+
+    return DeepgramSTTService
+
+
+def _load_google_stt() -> type[STTService]:
+    from pipecat.services.google.stt import GoogleSTTService
+
+    return GoogleSTTService
+
+
+def _load_groq_stt() -> type[STTService]:
+    from pipecat.services.groq.stt import GroqSTTService
+
+    return GroqSTTService
+
+
+def _load_nemotron_stt() -> type[STTService]:
+    from services.nvidia_stt import NVidiaWebSocketSTTService
+
+    return NVidiaWebSocketSTTService
+
+
+def _load_openai_stt() -> type[STTService]:
+    from pipecat.services.openai.stt import OpenAISTTService
+
+    return OpenAISTTService
+
+
+def _load_whisper_stt() -> type[STTService]:
+    from pipecat.services.whisper.stt import WhisperSTTService
+
+    return WhisperSTTService
+
+
+def _load_anthropic_llm() -> type[LLMService]:
+    from services.anthropic_llm import CachedSystemPromptAnthropicLLMService
+
+    return CachedSystemPromptAnthropicLLMService
+
+
+def _load_bedrock_llm() -> type[LLMService]:
+    from pipecat.services.aws.llm import AWSBedrockLLMService
+
+    return AWSBedrockLLMService
+
+
+def _load_cerebras_llm() -> type[LLMService]:
+    from pipecat.services.cerebras.llm import CerebrasLLMService
+
+    return CerebrasLLMService
+
+
+def _load_gemini_llm() -> type[LLMService]:
+    from pipecat.services.google.llm import GoogleLLMService
+
+    return GoogleLLMService
+
+
+def _load_groq_llm() -> type[LLMService]:
+    from pipecat.services.groq.llm import GroqLLMService
+
+    return GroqLLMService
+
+
+def _load_ollama_llm() -> type[LLMService]:
+    from pipecat.services.ollama.llm import OLLamaLLMService
+
+    return OLLamaLLMService
+
+
+def _load_openai_llm() -> type[LLMService]:
+    from pipecat.services.openai.llm import OpenAILLMService
+
+    return OpenAILLMService
+
+
+def _load_openrouter_llm() -> type[LLMService]:
+    from pipecat.services.openrouter.llm import OpenRouterLLMService
+
+    return OpenRouterLLMService
+
+
+def _speechmatics_stt_default_kwargs() -> dict[str, Any]:
+    from pipecat.services.speechmatics.stt import SpeechmaticsSTTService
+
+    return {
+        "params": SpeechmaticsSTTService.InputParams(
+            end_of_utterance_silence_trigger=0.5,
+        )
+    }
+
+
+def _cerebras_llm_default_kwargs() -> dict[str, Any]:
+    return {"retry_on_timeout": True, "retry_timeout_secs": 10.0}
+
+
 # =============================================================================
 # Provider Configuration Dataclasses
 # =============================================================================
@@ -156,40 +270,40 @@ class NoAuthMapper(CredentialMapper):
 
 @dataclass(frozen=True)
 class STTProviderConfig:
-    """Configuration for an STT provider with direct class reference.
+    """Configuration for an STT provider with a lazily imported service class.
 
     Attributes:
         provider_id: Enum identifier for this provider
         display_name: Human-readable name for UI (e.g., "Deepgram")
-        service_class: The actual pipecat service class (type-checked at import time)
+        load_service_class: Imports and returns the pipecat service class
         credential_mapper: Maps Settings fields to constructor kwargs
-        default_kwargs: Additional kwargs to pass to constructor
+        build_default_kwargs: Builds additional kwargs to pass to constructor
     """
 
     provider_id: STTProviderId
     display_name: str
-    service_class: type[STTService]
+    load_service_class: Callable[[], type[STTService]]
     credential_mapper: CredentialMapper
-    default_kwargs: dict[str, Any] = field(default_factory=dict)
+    build_default_kwargs: Callable[[], dict[str, Any]] = dict
 
 
 @dataclass(frozen=True)
 class LLMProviderConfig:
-    """Configuration for an LLM provider with direct class reference.
+    """Configuration for an LLM provider with a lazily imported service class.
 
     Attributes:
         provider_id: Enum identifier for this provider
         display_name: Human-readable name for UI (e.g., "OpenAI")
-        service_class: The actual pipecat service class (type-checked at import time)
+        load_service_class: Imports and returns the pipecat service class
         credential_mapper: Maps Settings fields to constructor kwargs
-        default_kwargs: Additional kwargs to pass to constructor
+        build_default_kwargs: Builds additional kwargs to pass to constructor
     """
 
     provider_id: LLMProviderId
     display_name: str
-    service_class: type[LLMService]
+    load_service_class: Callable[[], type[LLMService]]
     credential_mapper: CredentialMapper
-    default_kwargs: dict[str, Any] = field(default_factory=dict)
+    build_default_kwargs: Callable[[], dict[str, Any]] = dict
 
 
 # =============================================================================
@@ -200,24 +314,20 @@ STT_PROVIDERS: Final[dict[STTProviderId, STTProviderConfig]] = {
     STTProviderId.SPEECHMATICS: STTProviderConfig(
         provider_id=STTProviderId.SPEECHMATICS,
         display_name="Speechmatics",
-        service_class=SpeechmaticsSTTService,
+        load_service_class=_load_speechmatics_stt,
         credential_mapper=ApiKeyMapper("speechmatics_api_key"),
-        default_kwargs={
-            "params": SpeechmaticsSTTService.InputParams(
-                end_of_utterance_silence_trigger=0.5,
-            )
-        },
+        build_default_kwargs=_speechmatics_stt_default_kwargs,
     ),
     STTProviderId.ASSEMBLYAI: STTProviderConfig(
         provider_id=STTProviderId.ASSEMBLYAI,
         display_name="AssemblyAI",
-        service_class=AssemblyAISTTService,
+        load_service_class=_load_assemblyai_stt,
         credential_mapper=ApiKeyMapper("assemblyai_api_key"),
     ),
     STTProviderId.AWS: STTProviderConfig(
         provider_id=STTProviderId.AWS,
         display_name="AWS Transcribe",
-        service_class=AWSTranscribeSTTService,
+        load_service_class=_load_aws_stt,
         credential_mapper=MultiFieldMapper(
             {
                 "aws_access_key_id": "aws_access_key_id",
@@ -230,7 +340,7 @@ STT_PROVIDERS: Final[dict[STTProviderId, STTProviderConfig]] = {
     STTProviderId.AZURE: STTProviderConfig(
         provider_id=STTProviderId.AZURE,
         display_name="Azure Speech",
-        service_class=AzureSTTService,
+        load_service_class=_load_azure_stt,
         credential_mapper=MultiFieldMapper(
             {
                 "azure_speech_key": "api_key",
@@ -241,19 +351,19 @@ STT_PROVIDERS: Final[dict[STTProviderId, STTProviderConfig]] = {
     STTProviderId.CARTESIA: STTProviderConfig(
         provider_id=STTProviderId.CARTESIA,
         display_name="Cartesia",
-        service_class=CartesiaSTTService,
+        load_service_class=_load_cartesia_stt,
         credential_mapper=ApiKeyMapper("cartesia_api_key"),
     ),
     STTProviderId.DEEPGRAM: STTProviderConfig(
         provider_id=STTProviderId.DEEPGRAM,
         display_name="Deepgram",
-        service_class=DeepgramSTTService,
+        load_service_class=_load_deepgram_stt,
         credential_mapper=ApiKeyMapper("deepgram_api_key"),
     ),
     STTProviderId.GOOGLE: STTProviderConfig(
         provider_id=STTProviderId.GOOGLE,
         display_name="Google Speech",
-        service_class=GoogleSTTService,
+        load_service_class=_load_google_stt,
         credential_mapper=MultiFieldMapper(
             {"google_application_credentials": "credentials_path"},
             required_fields=("google_application_credentials",),
@@ -262,13 +372,13 @@ STT_PROVIDERS: Final[dict[STTProviderId, STTProviderConfig]] = {
     STTProviderId.GROQ: STTProviderConfig(
         provider_id=STTProviderId.GROQ,
         display_name="Groq",
-        service_class=GroqSTTService,
+        load_service_class=_load_groq_stt,
         credential_mapper=ApiKeyMapper("groq_api_key"),
     ),
     STTProviderId.NEMOTRON: STTProviderConfig(
         provider_id=STTProviderId.NEMOTRON,
         display_name="Nemotron ASR",
-        service_class=NVidiaWebSocketSTTService,
+        load_service_class=_load_nemotron_stt,
         credential_mapper=NoAuthMapper(
             availability_fields=("nemotron_asr_url",),
             field_mapping={"nemotron_asr_url": "url"},
@@ -277,13 +387,13 @@ STT_PROVIDERS: Final[dict[STTProviderId, STTProviderConfig]] = {
     STTProviderId.OPENAI: STTProviderConfig(
         provider_id=STTProviderId.OPENAI,
         display_name="OpenAI",
-        service_class=OpenAISTTService,
+        load_service_class=_load_openai_stt,
         credential_mapper=ApiKeyMapper("openai_api_key"),
     ),
     STTProviderId.WHISPER: STTProviderConfig(
         provider_id=STTProviderId.WHISPER,
         display_name="Whisper",
-        service_class=WhisperSTTService,
+        load_service_class=_load_whisper_stt,
         credential_mapper=NoAuthMapper(
             availability_fields=("whisper_enabled",),
             field_mapping={
@@ -304,13 +414,13 @@ LLM_PROVIDERS: Final[dict[LLMProviderId, LLMProviderConfig]] = {
     LLMProviderId.ANTHROPIC: LLMProviderConfig(
         provider_id=LLMProviderId.ANTHROPIC,
         display_name="Anthropic Claude",
-        service_class=AnthropicLLMService,
+        load_service_class=_load_anthropic_llm,
         credential_mapper=ApiKeyMapper("anthropic_api_key"),
     ),
     LLMProviderId.BEDROCK: LLMProviderConfig(
         provider_id=LLMProviderId.BEDROCK,
         display_name="AWS Bedrock",
-        service_class=AWSBedrockLLMService,
+        load_service_class=_load_bedrock_llm,
         credential_mapper=NoAuthMapper(
             availability_fields=("aws_bedrock_model_id",),
             field_mapping={
@@ -325,26 +435,26 @@ LLM_PROVIDERS: Final[dict[LLMProviderId, LLMProviderConfig]] = {
     LLMProviderId.CEREBRAS: LLMProviderConfig(
         provider_id=LLMProviderId.CEREBRAS,
         display_name="Cerebras",
-        service_class=CerebrasLLMService,
+        load_service_class=_load_cerebras_llm,
         credential_mapper=ApiKeyMapper("cerebras_api_key"),
-        default_kwargs={"retry_on_timeout": True, "retry_timeout_secs": 10.0},
+        build_default_kwargs=_cerebras_llm_default_kwargs,
     ),
     LLMProviderId.GEMINI: LLMProviderConfig(
         provider_id=LLMProviderId.GEMINI,
         display_name="Google Gemini",
-        service_class=GoogleLLMService,
+        load_service_class=_load_gemini_llm,
         credential_mapper=ApiKeyMapper("google_api_key"),
     ),
     LLMProviderId.GROQ: LLMProviderConfig(
         provider_id=LLMProviderId.GROQ,
         display_name="Groq",
-        service_class=GroqLLMService,
+        load_service_class=_load_groq_llm,
         credential_mapper=ApiKeyMapper("groq_api_key"),
     ),
     LLMProviderId.OLLAMA: LLMProviderConfig(
         provider_id=LLMProviderId.OLLAMA,
         display_name="Ollama",
-        service_class=OLLamaLLMService,
+        load_service_class=_load_ollama_llm,
         credential_mapper=NoAuthMapper(
             availability_fields=("ollama_base_url", "ollama_model"),
             field_mapping={
@@ -356,7 +466,7 @@ LLM_PROVIDERS: Final[dict[LLMProviderId, LLMProviderConfig]] = {
     LLMProviderId.OPENAI: LLMProviderConfig(
         provider_id=LLMProviderId.OPENAI,
         display_name="OpenAI",
-        service_class=OpenAILLMService,
+        load_service_class=_load_openai_llm,
         credential_mapper=MultiFieldMapper(
             {
                 "openai_api_key": "api_key",
@@ -368,7 +478,7 @@ LLM_PROVIDERS: Final[dict[LLMProviderId, LLMProviderConfig]] = {
     LLMProviderId.OPENROUTER: LLMProviderConfig(
         provider_id=LLMProviderId.OPENROUTER,
         display_name="OpenRouter",
-        service_class=OpenRouterLLMService,
+        load_service_class=_load_openrouter_llm,
         credential_mapper=ApiKeyMapper("openrouter_api_key"),
     ),
 }
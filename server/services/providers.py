@@ -35,6 +35,7 @@ __all__ = [
     "create_stt_service",
     "get_llm_provider_labels",
     "get_stt_provider_labels",
+    "load_service_classes",
 ]
 
 
@@ -45,7 +46,7 @@ def _create_stt_service_from_config(
     """Create an STT service instance from a provider config.
 
     Args:
-        config: The provider configuration with direct class reference
+        config: The provider configuration with its service class loader
         settings: Application settings containing API keys
 
     Returns:
@@ -64,13 +65,16 @@ def _create_stt_service_from_config(
 
     # Build kwargs from default kwargs + credential mapper.
     # Credential-mapped values (e.g., from .env) must win over defaults.
-    kwargs = dict(config.default_kwargs)
+    kwargs = config.build_default_kwargs()
     kwargs.update(config.credential_mapper.map_credentials(settings))
+    # Nothing after STT consumes audio (turns are driven externally), so stop each
+    # audio frame here instead of awaiting it through every downstream processor
+    kwargs["audio_passthrough"] = False
 
     logger.info(f"Creating STT service: {config.provider_id.value}")
 
-    # Direct instantiation - service_class is type-checked at import time
-    return config.service_class(**kwargs)
+    # Direct instantiation - the loader's import is type-checked statically
+    return config.load_service_class()(**kwargs)
 
 
 def _create_llm_service_from_config(
@@ -80,7 +84,7 @@ def _create_llm_service_from_config(
     """Create an LLM service instance from a provider config.
 
     Args:
-        config: The provider configuration with direct class reference
+        config: The provider configuration with its service class loader
         settings: Application settings containing API keys
 
     Returns:
@@ -99,13 +103,13 @@ def _create_llm_service_from_config(
 
     # Build kwargs from default kwargs + credential mapper.
     # Credential-mapped values (e.g., from .env) must win over defaults.
-    kwargs = dict(config.default_kwargs)
+    kwargs = config.build_default_kwargs()
     kwargs.update(config.credential_mapper.map_credentials(settings))
 
     logger.info(f"Creating LLM service: {config.provider_id.value}")
 
-    # Direct instantiation - service_class is type-checked at import time
-    return config.service_class(**kwargs)
+    # Direct instantiation - the loader's import is type-checked statically
+    return config.load_service_class()(**kwargs)
 
 
 def create_stt_service(provider_id: STTProviderId, settings: "Settings") -> STTService:
@@ -178,6 +182,26 @@ def get_available_llm_providers(settings: "Settings") -> list[LLMProviderId]:
     ]
 
 
+def load_service_classes(
+    stt_providers: list[STTProviderId],
+    llm_providers: list[LLMProviderId],
+) -> None:
+    """Import the service classes of the given providers.
+
+    The registry defers these imports so unconfigured providers are never loaded.
+    Loading the configured ones at startup keeps their import errors (and import
+    cost) out of the first client connection.
+
+    Args:
+        stt_providers: STT provider IDs whose service classes should be imported
+        llm_providers: LLM provider IDs whose service classes should be imported
+    """
+    for stt_provider_id in stt_providers:
+        STT_PROVIDERS[stt_provider_id].load_service_class()
+    for llm_provider_id in llm_providers:
+        LLM_PROVIDERS[llm_provider_id].load_service_class()
+
+
 def create_all_available_stt_services(
     settings: "Settings",
     available_providers: list[STTProviderId],
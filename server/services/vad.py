@@ -0,0 +1,161 @@
+"""Silero voice activity detection tuned for small transport audio frames."""
+
+import time
+from importlib.resources import files
+from typing import Final
+
+from onnxruntime import (
+    ExecutionMode,
+    GraphOptimizationLevel,
+    InferenceSession,
+    SessionOptions,
+)
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+
+SILERO_MODEL_PACKAGE: Final[str] = "pipecat.audio.vad.data"
+SILERO_MODEL_NAME: Final[str] = "silero_vad.onnx"
+# Quiet windows still run through the model at the start of a quiet stretch (512ms at
+# 16kHz), long enough for its recurrent state to settle on the noise floor
+QUIET_SETTLING_WINDOWS: Final[int] = 16
+
+
+def load_silero_vad_session() -> InferenceSession:
+    """Load the Silero VAD model bundled with pipecat into an ONNX runtime session.
+
+    The session only holds the model graph; the recurrent state is passed in on every
+    run, so one session can serve the analyzers of all connections.
+
+    Returns:
+        Single-threaded CPU inference session, configured like pipecat's own loader
+    """
+    session_options = SessionOptions()
+    # One 512-sample window per run: a thread pool would only contend with the event loop
+    session_options.inter_op_num_threads = 1
+    session_options.intra_op_num_threads = 1
+    session_options.execution_mode = ExecutionMode.ORT_SEQUENTIAL
+    session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+    model_path = str(files(SILERO_MODEL_PACKAGE).joinpath(SILERO_MODEL_NAME))
+    return InferenceSession(
+        model_path, providers=["CPUExecutionProvider"], sess_options=session_options
+    )
+
+
+class SharedSessionSileroModel(SileroOnnxModel):
+    """Silero model wrapper that keeps its own stream state over a shared session.
+
+    Connections run their analyzers in their own executor threads, so the shared
+    session can see concurrent run() calls. ONNX Runtime allows that on one session,
+    and SileroOnnxModel.__call__ passes the recurrent state and audio context in and
+    takes them back out on every run. Both stay on the wrapper, so each connection
+    keeps its own state and the session holds nothing between runs.
+
+    SileroOnnxModel.__init__ is skipped, so this is covered by the same pipecat-ai
+    pin and tests/test_vad.py guard as BufferedSileroVADAnalyzer.
+    """
+
+    def __init__(self, session: InferenceSession) -> None:
+        """Initialize the wrapper without loading the model again.
+
+        Args:
+            session: Inference session from load_silero_vad_session()
+        """
+        self.session = session
+        self.reset_states()
+        self.sample_rates = [8000, 16000]
+
+
+class BufferedSileroVADAnalyzer(SileroVADAnalyzer):
+    """Silero VAD analyzer that only hops to its executor for full model windows.
+
+    The base analyzer runs every incoming audio frame through a thread executor,
+    even though frames shorter than one model window (512 samples at 16kHz) are
+    only appended to its buffer. Silero keeps recurrent state between windows, so
+    windows cannot be batched into one inference; instead, sub-window frames are
+    buffered on the event loop and the executor is used only when a window can run.
+
+    The model is not loaded per analyzer: every connection's analyzer runs on the
+    session loaded once at startup and only keeps its own recurrent state.
+
+    Windows quieter than params.min_volume can never count as speech, whatever the
+    model says, so the cheaper volume check runs first. The model still sees the
+    first half second of a quiet stretch, so its state settles on the noise floor
+    much as it would if it saw every window; after that the state is frozen and the
+    model is skipped until the audio is loud enough to be speech again. Speech after
+    a pause of a second or more can start a few windows earlier than with the base
+    analyzer, whose state keeps drifting through the silence.
+
+    This relies on private VADAnalyzer internals (the window buffer, _run_analyzer
+    and _get_smoothed_volume), so pipecat-ai is pinned below its next release and
+    tests/test_vad.py checks that those internals are still there.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: InferenceSession,
+        sample_rate: int | None = None,
+        params: VADParams | None = None,
+    ) -> None:
+        """Initialize the analyzer on a preloaded Silero session.
+
+        Args:
+            session: Inference session from load_silero_vad_session()
+            sample_rate: Audio sample rate (8000 or 16000 Hz), or None to set it later
+            params: VAD parameters for detection thresholds and timing
+        """
+        # Skip SileroVADAnalyzer.__init__, which loads a new session from disk
+        VADAnalyzer.__init__(self, sample_rate=sample_rate, params=params)
+        self._model = SharedSessionSileroModel(session)
+        self._last_reset_time = 0
+        # Volume computed ahead of the model for the window being analyzed
+        self._window_volume: float | None = None
+        self._quiet_window_count = 0
+
+    async def analyze_audio(self, buffer: bytes) -> VADState:
+        """Analyze an audio buffer and return the current VAD state.
+
+        Args:
+            buffer: Audio buffer to analyze.
+
+        Returns:
+            Current VAD state after processing the buffer.
+        """
+        # The transport awaits each frame in turn, so no analyzer run is in flight here
+        if len(self._vad_buffer) + len(buffer) < self._vad_frames_num_bytes:
+            self._vad_buffer += buffer
+            return self._vad_state
+        return await super().analyze_audio(buffer)
+
+    def voice_confidence(self, buffer: bytes) -> float:
+        """Return the voice confidence of a window, skipping the model for quiet windows.
+
+        Args:
+            buffer: Audio window to analyze.
+
+        Returns:
+            Voice confidence between 0.0 and 1.0, or 0.0 for a skipped quiet window.
+        """
+        window_volume = super()._get_smoothed_volume(buffer)
+        self._window_volume = window_volume
+        if window_volume < self._params.min_volume:
+            self._quiet_window_count += 1
+            if self._quiet_window_count > QUIET_SETTLING_WINDOWS:
+                return 0.0
+        elif self._quiet_window_count:
+            if self._quiet_window_count > QUIET_SETTLING_WINDOWS:
+                # The base class resets the model every few seconds on its next run; a
+                # reset on the first speech window after a skipped stretch would drop
+                # the settled state, so restart that clock instead
+                self._last_reset_time = time.time()
+            self._quiet_window_count = 0
+        return super().voice_confidence(buffer)
+
+    def _get_smoothed_volume(self, audio: bytes) -> float:
+        # The base analyzer asks for the volume right after the confidence, for the
+        # same window, so reuse the value computed in voice_confidence()
+        window_volume = self._window_volume
+        if window_volume is None:
+            return super()._get_smoothed_volume(audio)
+        self._window_volume = None
+        return window_volume
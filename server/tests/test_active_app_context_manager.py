@@ -122,6 +122,18 @@ def test_reset_context_for_new_recording_omits_focus_block_when_everything_is_un
     assert extract_system_message_contents(context_manager) == [context_manager.system_prompt]
 
 
+def test_system_prompt_is_reused_until_prompt_sections_change() -> None:
+    context_manager = DictationContextManager()
+    default_system_prompt = context_manager.system_prompt
+    assert context_manager.system_prompt is default_system_prompt
+
+    context_manager.set_prompt_sections(main_custom="Custom main prompt")
+    custom_system_prompt = context_manager.system_prompt
+    assert custom_system_prompt != default_system_prompt
+    assert "Custom main prompt" in custom_system_prompt
+    assert context_manager.system_prompt is custom_system_prompt
+
+
 def test_active_app_context_block_omits_window_line_when_window_is_unknown() -> None:
     context_manager = DictationContextManager()
     context_manager.set_active_app_context(
@@ -229,3 +241,24 @@ def test_sanitized_focus_text_factory_sanitizes_and_truncates() -> None:
     )
     assert sanitized_focus_text is not None
     assert sanitized_focus_text.value == "line one..."
+
+
+def test_active_app_context_block_is_reformatted_only_when_focus_fields_change() -> None:
+    context_manager = DictationContextManager()
+    context_manager.set_active_app_context(build_fresh_active_app_context_snapshot())
+    context_manager.reset_context_for_new_recording()
+    first_focus_block = extract_injected_focus_message_content(context_manager)
+
+    context_manager.set_active_app_context(build_fresh_active_app_context_snapshot())
+    context_manager.reset_context_for_new_recording()
+    assert extract_injected_focus_message_content(context_manager) is first_focus_block
+
+    context_manager.set_active_app_context(
+        build_fresh_active_app_context_snapshot().model_copy(
+            update={"focused_window": FocusedWindow(title="todo.md")}
+        )
+    )
+    context_manager.reset_context_for_new_recording()
+    changed_focus_block = extract_injected_focus_message_content(context_manager)
+    assert '"todo.md"' in changed_focus_block
+    assert '"notes.md"' not in changed_focus_block
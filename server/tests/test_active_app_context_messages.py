@@ -1,12 +1,12 @@
 from datetime import UTC, datetime
 
-from protocol.messages import StartRecordingMessage, parse_client_message
+from protocol.messages import StartRecordingMessage, StopRecordingMessage, parse_client_message
 
 
-def build_active_app_context_payload() -> dict[str, object]:
+def build_active_app_context_payload(window_title: str = "main.py") -> dict[str, object]:
     return {
         "focused_application": {"display_name": "Code"},
-        "focused_window": {"title": "main.py"},
+        "focused_window": {"title": window_title},
         "event_source": "polling",
         "confidence_level": "high",
         "captured_at": datetime.now(tz=UTC).isoformat(),
@@ -69,3 +69,54 @@ def test_start_recording_with_non_mapping_active_app_context_still_parses() -> N
     assert isinstance(parsed_message, StartRecordingMessage)
 
     assert parsed_message.active_app_context_for_recording() is None
+
+
+def test_dataless_messages_reuse_parse_but_context_messages_do_not() -> None:
+    first_stop_message = parse_client_message({"type": "stop-recording", "data": {}})
+    second_stop_message = parse_client_message({"type": "stop-recording", "data": {}})
+    assert isinstance(first_stop_message, StopRecordingMessage)
+    assert second_stop_message is first_stop_message
+
+    empty_start_message = parse_client_message({"type": "start-recording", "data": {}})
+    context_start_message = parse_client_message(
+        {
+            "type": "start-recording",
+            "data": {"active_app_context": build_active_app_context_payload()},
+        }
+    )
+    assert isinstance(empty_start_message, StartRecordingMessage)
+    assert isinstance(context_start_message, StartRecordingMessage)
+    assert empty_start_message.active_app_context_for_recording() is None
+    assert context_start_message.active_app_context_for_recording() is not None
+
+
+def test_context_messages_after_a_focus_change_are_parsed_again() -> None:
+    parsed_messages = [
+        parse_client_message(
+            {
+                "type": "start-recording",
+                "data": {"active_app_context": build_active_app_context_payload(window_title)},
+            }
+        )
+        for window_title in ("main.py", "notes.md")
+    ]
+    # A dataless start-recording in between must not be served for the context messages
+    dataless_start_message = parse_client_message({"type": "start-recording", "data": {}})
+    parsed_messages.append(
+        parse_client_message(
+            {
+                "type": "start-recording",
+                "data": {"active_app_context": build_active_app_context_payload("todo.md")},
+            }
+        )
+    )
+
+    focused_window_titles: list[str] = []
+    for parsed_message in parsed_messages:
+        assert isinstance(parsed_message, StartRecordingMessage)
+        assert parsed_message is not dataless_start_message
+        active_app_context_snapshot = parsed_message.active_app_context_for_recording()
+        assert active_app_context_snapshot is not None
+        assert active_app_context_snapshot.focused_window is not None
+        focused_window_titles.append(active_app_context_snapshot.focused_window.title)
+    assert focused_window_titles == ["main.py", "notes.md", "todo.md"]
@@ -0,0 +1,61 @@
+from typing import Any, cast
+
+import pytest
+from anthropic import NOT_GIVEN
+from pipecat.processors.aggregators.llm_context import LLMContext, LLMContextMessage
+
+from services.anthropic_llm import CachedSystemPromptAnthropicLLMService, get_cached_system_blocks
+
+
+def build_invocation_params(messages: list[dict[str, Any]]) -> dict[str, Any]:
+    service = CachedSystemPromptAnthropicLLMService(api_key="test-key")
+    context = LLMContext(cast(list[LLMContextMessage], messages))
+    params = service.get_llm_adapter().get_llm_invocation_params(
+        context, enable_prompt_caching=False
+    )
+    return cast(dict[str, Any], params)
+
+
+def test_system_prompt_is_sent_as_cached_text_block() -> None:
+    params = build_invocation_params(
+        [
+            {"role": "system", "content": "Format the dictation."},
+            {"role": "user", "content": "hello world"},
+        ]
+    )
+
+    assert params["system"] == [
+        {
+            "type": "text",
+            "text": "Format the dictation.",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    ("messages", "expected_system"),
+    [
+        ([{"role": "user", "content": "hello world"}], NOT_GIVEN),
+        (
+            [{"role": "system", "content": ""}, {"role": "user", "content": "hello world"}],
+            "",
+        ),
+    ],
+)
+def test_missing_or_empty_system_prompt_passes_through(
+    messages: list[dict[str, Any]], expected_system: object
+) -> None:
+    assert build_invocation_params(messages)["system"] == expected_system
+
+
+def test_system_text_blocks_get_breakpoint_on_a_copy_of_the_last_block() -> None:
+    system_blocks = [{"type": "text", "text": "Part one."}, {"type": "text", "text": "Part two."}]
+
+    cached_system_blocks = get_cached_system_blocks(system_blocks)
+
+    assert cached_system_blocks == [
+        {"type": "text", "text": "Part one."},
+        {"type": "text", "text": "Part two.", "cache_control": {"type": "ephemeral"}},
+    ]
+    assert "cache_control" not in system_blocks[-1]
@@ -0,0 +1,23 @@
+from main import filter_mdns_candidates_from_sdp, is_mdns_candidate
+
+
+def test_filter_mdns_candidates_from_sdp_drops_only_mdns_candidate_lines() -> None:
+    sdp = (
+        "v=0\r\n"
+        "a=candidate:1 1 udp 2122260223 a8b3c4d5-e6f7.local 54321 typ host\r\n"
+        "a=candidate:2 1 udp 1686052607 203.0.113.7 54321 typ srflx\r\n"
+        "a=candidate:3 1 udp 2122260223 F1E2D3C4-B5A6.LOCAL 54322 typ host\r\n"
+        "a=end-of-candidates\r\n"
+    )
+
+    assert filter_mdns_candidates_from_sdp(sdp) == (
+        "v=0\r\n"
+        "a=candidate:2 1 udp 1686052607 203.0.113.7 54321 typ srflx\r\n"
+        "a=end-of-candidates\r\n"
+    )
+
+
+def test_is_mdns_candidate_matches_local_addresses_only() -> None:
+    assert is_mdns_candidate("candidate:1 1 udp 2122260223 A8B3-C4D5.local 54321 typ host")
+    assert is_mdns_candidate("candidate:3 1 udp 2122260223 A8B3-C4D5.Local 54321 typ host")
+    assert not is_mdns_candidate("candidate:2 1 udp 1686052607 203.0.113.7 54321 typ srflx")
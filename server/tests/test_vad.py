@@ -0,0 +1,232 @@
+import asyncio
+import inspect
+import itertools
+import math
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
+
+import numpy as np
+from onnxruntime import InferenceSession
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+
+from services.vad import (
+    QUIET_SETTLING_WINDOWS,
+    SILERO_MODEL_NAME,
+    SILERO_MODEL_PACKAGE,
+    BufferedSileroVADAnalyzer,
+    SharedSessionSileroModel,
+    load_silero_vad_session,
+)
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 160
+WINDOW_SAMPLES = 512
+
+# Accept any confidence so the tone drives the analyzer through every state
+PERMISSIVE_VAD_PARAMS = VADParams(confidence=0.0, start_secs=0.1, stop_secs=0.1, min_volume=0.1)
+
+
+# (F1, F2, F3) formant frequencies of the vowels in "father", "heed", "head" and "who'd"
+VOWEL_FORMANTS = ((730, 1090, 2440), (270, 2290, 3010), (530, 1840, 2480), (300, 870, 2240))
+FORMANT_BANDWIDTHS = (90, 110, 150)
+
+
+# A gliding 120Hz voice shaped by one vowel's formants after another, with a 4Hz syllable
+# envelope: Silero scores it well above its default confidence, without a recording
+def synthesize_speech(seconds: float) -> np.ndarray:
+    sample_count = int(seconds * SAMPLE_RATE)
+    times = np.arange(sample_count) / SAMPLE_RATE
+    pitch = 120 + 20 * np.sin(2 * np.pi * 2.5 * times)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    vowel_index = np.minimum(
+        (times * len(VOWEL_FORMANTS) / seconds).astype(int), len(VOWEL_FORMANTS) - 1
+    )
+    signal = np.zeros(sample_count)
+    for harmonic in range(1, 30):
+        harmonic_frequency = harmonic * pitch
+        formant_gain = np.zeros(sample_count)
+        for index, formants in enumerate(VOWEL_FORMANTS):
+            vowel_gain = sum(
+                1 / (1 + ((harmonic_frequency - formant) / bandwidth) ** 2)
+                for formant, bandwidth in zip(formants, FORMANT_BANDWIDTHS, strict=True)
+            )
+            formant_gain = np.where(vowel_index == index, vowel_gain, formant_gain)
+        signal += formant_gain / harmonic * np.sin(harmonic * phase)
+    signal *= 0.55 - 0.45 * np.cos(2 * np.pi * 4 * times)
+    return 0.5 * signal / np.abs(signal).max()
+
+
+def build_speech_pause_speech_frames() -> list[bytes]:
+    random_generator = np.random.default_rng(0)
+    speech = synthesize_speech(1.0)
+    # A faint noise floor, like a quiet room, below the default min_volume
+    pause = random_generator.normal(0, 0.002, SAMPLE_RATE)
+    audio = np.concatenate([pause[:4000], speech, pause, speech, pause])
+    pcm = (np.clip(audio, -1, 1) * 32767).astype("<i2").tobytes()
+    frame_num_bytes = FRAME_SAMPLES * 2
+    return [pcm[start : start + frame_num_bytes] for start in range(0, len(pcm), frame_num_bytes)]
+
+
+def build_audio_frames() -> list[bytes]:
+    silence = bytes(FRAME_SAMPLES * 2)
+    tone_samples = [
+        int(12000 * math.sin(2 * math.pi * 440 * index / SAMPLE_RATE))
+        for index in range(FRAME_SAMPLES)
+    ]
+    tone = struct.pack(f"<{FRAME_SAMPLES}h", *tone_samples)
+    return [silence] * 40 + [tone] * 120 + [silence] * 120
+
+
+async def collect_states(analyzer: SileroVADAnalyzer, frames: list[bytes]) -> list[str]:
+    analyzer.set_sample_rate(SAMPLE_RATE)
+    return [(await analyzer.analyze_audio(frame)).name for frame in frames]
+
+
+def test_buffered_analyzer_matches_base_analyzer_states() -> None:
+    frames = build_audio_frames()
+    base_analyzer = SileroVADAnalyzer(params=PERMISSIVE_VAD_PARAMS)
+    buffered_analyzer = BufferedSileroVADAnalyzer(
+        session=load_silero_vad_session(), params=PERMISSIVE_VAD_PARAMS
+    )
+
+    base_states = asyncio.run(collect_states(base_analyzer, frames))
+    buffered_states = asyncio.run(collect_states(buffered_analyzer, frames))
+
+    assert {"QUIET", "STARTING", "SPEAKING", "STOPPING"} <= set(base_states)
+    assert buffered_states == base_states
+
+
+def test_buffered_analyzer_matches_base_analyzer_on_speech_at_default_params() -> None:
+    frames = build_speech_pause_speech_frames()
+    base_analyzer = SileroVADAnalyzer()
+    buffered_analyzer = BufferedSileroVADAnalyzer(session=load_silero_vad_session())
+
+    base_states = asyncio.run(collect_states(base_analyzer, frames))
+    buffered_states = asyncio.run(collect_states(buffered_analyzer, frames))
+
+    speech_start_count = sum(
+        1
+        for previous_state, state in itertools.pairwise(base_states)
+        if (previous_state, state) == ("QUIET", "STARTING")
+    )
+    assert speech_start_count == 2
+    assert buffered_states == base_states
+
+
+def test_models_sharing_a_session_keep_independent_state() -> None:
+    random_generator = np.random.default_rng(7)
+    windows = [
+        random_generator.uniform(-0.5, 0.5, WINDOW_SAMPLES).astype(np.float32) for _ in range(20)
+    ]
+    session = load_silero_vad_session()
+    first_model = SharedSessionSileroModel(session)
+    second_model = SharedSessionSileroModel(session)
+
+    interleaved_confidences: list[float] = []
+    for window in windows:
+        interleaved_confidences.append(float(first_model(window, SAMPLE_RATE)[0][0]))
+        second_model(np.zeros(WINDOW_SAMPLES, dtype=np.float32), SAMPLE_RATE)
+
+    separate_model = SharedSessionSileroModel(load_silero_vad_session())
+    separate_confidences = [float(separate_model(window, SAMPLE_RATE)[0][0]) for window in windows]
+
+    assert interleaved_confidences == separate_confidences
+
+
+def test_models_sharing_a_session_run_concurrently() -> None:
+    random_generator = np.random.default_rng(11)
+    streams = [
+        [random_generator.uniform(-0.5, 0.5, WINDOW_SAMPLES).astype(np.float32) for _ in range(50)]
+        for _ in range(4)
+    ]
+
+    def run_stream(model: SharedSessionSileroModel, windows: list[np.ndarray]) -> list[float]:
+        return [float(model(window, SAMPLE_RATE)[0][0]) for window in windows]
+
+    session = load_silero_vad_session()
+    with ThreadPoolExecutor(max_workers=len(streams)) as executor:
+        concurrent_confidences = list(
+            executor.map(
+                lambda windows: run_stream(SharedSessionSileroModel(session), windows), streams
+            )
+        )
+
+    separate_confidences = [
+        run_stream(SharedSessionSileroModel(load_silero_vad_session()), windows)
+        for windows in streams
+    ]
+    assert concurrent_confidences == separate_confidences
+
+
+class CountingSileroModel(SharedSessionSileroModel):
+    def __init__(self, session: InferenceSession) -> None:
+        super().__init__(session)
+        self.call_count = 0
+
+    def __call__(self, x: np.ndarray, sr: int) -> np.ndarray:
+        self.call_count += 1
+        return super().__call__(x, sr)
+
+
+def test_buffered_analyzer_skips_model_below_min_volume() -> None:
+    session = load_silero_vad_session()
+    analyzer = BufferedSileroVADAnalyzer(session=session)
+    counting_model = CountingSileroModel(session)
+    analyzer._model = counting_model
+    silence_frames = [bytes(FRAME_SAMPLES * 2)] * 100
+
+    states = asyncio.run(collect_states(analyzer, silence_frames))
+
+    assert set(states) == {"QUIET"}
+    assert counting_model.call_count == QUIET_SETTLING_WINDOWS
+
+
+# pipecat internals BufferedSileroVADAnalyzer relies on, mapped to their parameter names
+PIPECAT_VAD_ANALYZER_METHODS = {
+    "analyze_audio": ["self", "buffer"],
+    "voice_confidence": ["self", "buffer"],
+    "_run_analyzer": ["self", "buffer"],
+    "_get_smoothed_volume": ["self", "audio"],
+}
+
+
+def test_pipecat_vad_analyzer_internals_are_unchanged() -> None:
+    for method_name, parameter_names in PIPECAT_VAD_ANALYZER_METHODS.items():
+        method = getattr(SileroVADAnalyzer, method_name)
+        assert list(inspect.signature(method).parameters) == parameter_names, method_name
+    vad_analyzer_init_parameters = inspect.signature(VADAnalyzer.__init__).parameters
+    assert list(vad_analyzer_init_parameters) == ["self", "sample_rate", "params"]
+
+    base_analyzer = SileroVADAnalyzer()
+    base_analyzer.set_sample_rate(SAMPLE_RATE)
+    assert isinstance(base_analyzer._vad_buffer, bytes)
+    assert base_analyzer._vad_frames_num_bytes == WINDOW_SAMPLES * 2
+    assert isinstance(base_analyzer._vad_state, VADState)
+    assert isinstance(base_analyzer._last_reset_time, int | float)
+
+    # SileroVADAnalyzer.__init__ is skipped, so it must not set anything else
+    buffered_analyzer = BufferedSileroVADAnalyzer(session=load_silero_vad_session())
+    buffered_analyzer.set_sample_rate(SAMPLE_RATE)
+    assert vars(base_analyzer).keys() <= vars(buffered_analyzer).keys()
+
+
+def test_pipecat_silero_model_internals_are_unchanged() -> None:
+    call_parameters = inspect.signature(SileroOnnxModel.__call__).parameters
+    assert list(call_parameters) == ["self", "x", "sr"]
+    reset_states_parameters = inspect.signature(SileroOnnxModel.reset_states).parameters
+    assert list(reset_states_parameters) == ["self", "batch_size"]
+
+    # SileroOnnxModel.__init__ is skipped, so the wrapper must set the same attributes
+    model_path = str(files(SILERO_MODEL_PACKAGE).joinpath(SILERO_MODEL_NAME))
+    base_model = SileroOnnxModel(model_path)
+    session = load_silero_vad_session()
+    assert vars(SharedSessionSileroModel(session)).keys() == vars(base_model).keys()
+
+    # The recurrent state goes in and out of every run rather than living in the session
+    assert {session_input.name for session_input in session.get_inputs()} == {
+        "input",
+        "state",
+        "sr",
+    }
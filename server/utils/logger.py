@@ -9,6 +9,10 @@ from loguru import logger
 if TYPE_CHECKING:
     from loguru import Record
 
+# Severity number of the configured stdout handler. loguru has no public accessor
+# for it; 0 treats every level as enabled until configure_logging() runs.
+_configured_level_no: int = 0
+
 
 def _should_log(record: "Record") -> bool:
     """Filter out known harmless warnings from pipecat transport layer."""
@@ -56,6 +60,9 @@ def configure_logging(log_level: str | None = None) -> None:
     else:
         log_level_str = os.getenv("LOG_LEVEL", "INFO").upper()
 
+    global _configured_level_no
+    _configured_level_no = logger.level(log_level_str).no
+
     # Remove default handler
     logger.remove()
 
@@ -67,3 +74,14 @@ def configure_logging(log_level: str | None = None) -> None:
         colorize=True,
         filter=_should_log,
     )
+
+
+def is_level_enabled(level: str) -> bool:
+    """Check whether messages at the given level reach the configured handler.
+
+    Lets per-frame code skip building log messages that would be discarded.
+
+    Args:
+        level: A loguru level name (e.g., "DEBUG")
+    """
+    return logger.level(level).no >= _configured_level_no
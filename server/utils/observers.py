@@ -3,7 +3,11 @@
 Filters frames by source to avoid duplicate logs as frames propagate through the pipeline.
 """
 
+from collections.abc import Callable
+from typing import Any, Final
+
 from pipecat.frames.frames import (
+    Frame,
     InputAudioRawFrame,
     LLMFullResponseEndFrame,
     LLMFullResponseStartFrame,
@@ -17,13 +21,30 @@ from pipecat.frames.frames import (
     UserStoppedSpeakingFrame,
 )
 from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.frame_processor import FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIServerMessageFrame
 from pipecat.services.llm_service import LLMService
 from pipecat.services.stt_service import STTService
 from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 
-from utils.logger import logger
+from utils.logger import is_level_enabled, logger
+
+# Handles a pushed frame and returns whether it was logged. Unhandled frames fall
+# through to the generic debug log.
+type FrameLogHandler = Callable[[Any, FrameProcessor], bool]
+
+# Frames too noisy for the generic debug log, resolved once per concrete frame type.
+# LLMTextFrame and TranscriptionFrame are TextFrames.
+QUIET_FRAME_TYPES: Final[tuple[type[Frame], ...]] = (
+    UserSpeakingFrame,
+    MetricsFrame,
+    TextFrame,
+)
+
+# Log every 512th input audio frame (~10s at 20ms frames); a power of two so the
+# per-frame check is a bit mask
+AUDIO_FRAME_LOG_MASK: Final[int] = 512 - 1
 
 
 class PipelineLogObserver(BaseObserver):
@@ -38,16 +59,47 @@ class PipelineLogObserver(BaseObserver):
 
     Logs at DEBUG level:
     - Other frames (excluding noisy UserSpeakingFrame and MetricsFrame)
+
+    Every pushed frame reaches this observer once per processor hop, so handlers
+    and the quiet-frame check are looked up by the frame's concrete type in a dict
+    instead of walking a chain of isinstance checks. Per-frame messages pass their
+    values as loguru arguments so they are only formatted when a handler accepts
+    the level.
     """
 
+    __slots__ = (
+        "_audio_frame_count",
+        "_handlers_by_base_type",
+        "_handlers_by_frame_type",
+        "_is_accumulating",
+        "_is_debug_enabled",
+        "_is_speaking",
+        "_llm_accumulator",
+    )
+
     def __init__(self) -> None:
         """Initialize the observer."""
         super().__init__()
-        self._llm_accumulator: str = ""
+        self._llm_accumulator: list[str] = []
         self._is_accumulating: bool = False
         self._audio_frame_count: int = 0
         # Track speaking state to deduplicate speech events from multiple sources
         self._is_speaking: bool = False
+        self._is_debug_enabled: bool = is_level_enabled("DEBUG")
+        # Ordered like the original match cases: the first base class wins
+        self._handlers_by_base_type: dict[type[Frame], FrameLogHandler] = {
+            StartFrame: self._log_start_frame,
+            InputAudioRawFrame: self._log_audio_frame,
+            TranscriptionFrame: self._log_transcription_frame,
+            UserStartedSpeakingFrame: self._log_user_started_speaking,
+            UserStoppedSpeakingFrame: self._log_user_stopped_speaking,
+            LLMFullResponseStartFrame: self._start_llm_response,
+            LLMTextFrame: self._accumulate_llm_text,
+            LLMFullResponseEndFrame: self._log_llm_response,
+            RTVIServerMessageFrame: self._log_rtvi_server_message,
+        }
+        # Concrete frame type -> (resolved handler, is quiet), filled on first sight
+        self._handlers_by_frame_type: dict[type[Frame], tuple[FrameLogHandler, bool]] = {}
 
     async def on_push_frame(self, data: FramePushed) -> None:
         """Handle frame push events and log key pipeline activities.
@@ -55,59 +107,121 @@ class PipelineLogObserver(BaseObserver):
         Args:
             data: The frame push event data containing source, frame, and other info.
         """
-        src = data.source
         frame = data.frame
-
-        match (frame, src):
-            # Log pipeline start when it reaches the output transport (end of pipeline)
-            case (StartFrame(), BaseOutputTransport()):
-                logger.success("Pipeline started")
-
-            # Log audio frames from input transport (periodic sampling)
-            case (InputAudioRawFrame() as f, BaseInputTransport()):
-                self._audio_frame_count += 1
-                if self._audio_frame_count % 500 == 0:
-                    logger.info(
-                        f"Audio frame #{self._audio_frame_count}: "
-                        f"{len(f.audio)} bytes, {f.sample_rate}Hz, {f.num_channels}ch"
-                    )
-
-            # Log transcription from STT service
-            case (TranscriptionFrame() as f, STTService()):
-                logger.info(f"TRANSCRIPTION: '{f.text}'")
-
-            # Log speech start from input transport (where VAD runs)
-            # Use state tracking to deduplicate - same event may come from multiple sources
-            case (UserStartedSpeakingFrame(), BaseInputTransport()) if not self._is_speaking:
-                self._is_speaking = True
-                logger.info("Speech started")
-
-            # Log speech stop from input transport
-            case (UserStoppedSpeakingFrame(), BaseInputTransport()) if self._is_speaking:
-                self._is_speaking = False
-                logger.info("Speech stopped")
-
-            # Accumulate and log LLM response from LLM service
-            # Use LLMTextFrame (not TextFrame) - this is what LLM services output
-            case (LLMFullResponseStartFrame(), LLMService()):
-                self._llm_accumulator = ""
-                self._is_accumulating = True
-
-            case (LLMTextFrame() as f, LLMService()) if self._is_accumulating:
-                self._llm_accumulator += f.text
-
-            case (LLMFullResponseEndFrame(), LLMService()):
-                self._is_accumulating = False
-                if self._llm_accumulator.strip():
-                    logger.info(f"Cleaned text: '{self._llm_accumulator.strip()}'")
-                self._llm_accumulator = ""
-
-            # Log RTVI server messages when sent from output transport
-            case (RTVIServerMessageFrame() as f, BaseOutputTransport()):
-                logger.info(f"Sending to client: {f.data}")
-
-            # Log other frames at debug level (skip noisy ones)
-            case _ if not isinstance(
-                frame, UserSpeakingFrame | MetricsFrame | TextFrame | LLMTextFrame
-            ):
-                logger.debug(f"Frame: {type(frame).__name__}")
+        frame_type = type(frame)
+
+        resolved = self._handlers_by_frame_type.get(frame_type)
+        if resolved is None:
+            resolved = self._resolve_handler(frame_type)
+        handler, is_quiet = resolved
+
+        if handler(frame, data.source):
+            return
+
+        # Log other frames at debug level (skip noisy ones)
+        if self._is_debug_enabled and not is_quiet:
+            logger.debug("Frame: {}", frame_type.__name__)
+
+    def _resolve_handler(self, frame_type: type[Frame]) -> tuple[FrameLogHandler, bool]:
+        """Find and cache the handler and quietness for a concrete frame type."""
+        handler = next(
+            (
+                base_handler
+                for base_type, base_handler in self._handlers_by_base_type.items()
+                if issubclass(frame_type, base_type)
+            ),
+            self._skip_frame,
+        )
+        resolved = (handler, issubclass(frame_type, QUIET_FRAME_TYPES))
+        self._handlers_by_frame_type[frame_type] = resolved
+        return resolved
+
+    def _skip_frame(self, _frame: Frame, _source: FrameProcessor) -> bool:
+        return False
+
+    def _log_start_frame(self, _frame: StartFrame, source: FrameProcessor) -> bool:
+        # Log pipeline start when it reaches the output transport (end of pipeline)
+        if not isinstance(source, BaseOutputTransport):
+            return False
+        logger.success("Pipeline started")
+        return True
+
+    def _log_audio_frame(self, frame: InputAudioRawFrame, source: FrameProcessor) -> bool:
+        # Log audio frames from input transport (periodic sampling)
+        if not isinstance(source, BaseInputTransport):
+            return False
+        audio_frame_count = self._audio_frame_count + 1
+        self._audio_frame_count = audio_frame_count
+        if audio_frame_count & AUDIO_FRAME_LOG_MASK == 0:
+            logger.info(
+                "Audio frame #{}: {} bytes, {}Hz, {}ch",
+                audio_frame_count,
+                len(frame.audio),
+                frame.sample_rate,
+                frame.num_channels,
+            )
+        return True
+
+    def _log_transcription_frame(self, frame: TranscriptionFrame, source: FrameProcessor) -> bool:
+        # Log transcription from STT service
+        if not isinstance(source, STTService):
+            return False
+        logger.info("TRANSCRIPTION: '{}'", frame.text)
+        return True
+
+    def _log_user_started_speaking(
+        self, _frame: UserStartedSpeakingFrame, source: FrameProcessor
+    ) -> bool:
+        # Log speech start from input transport (where VAD runs)
+        # Use state tracking to deduplicate - same event may come from multiple sources
+        if not isinstance(source, BaseInputTransport) or self._is_speaking:
+            return False
+        self._is_speaking = True
+        logger.info("Speech started")
+        return True
+
+    def _log_user_stopped_speaking(
+        self, _frame: UserStoppedSpeakingFrame, source: FrameProcessor
+    ) -> bool:
+        # Log speech stop from input transport
+        if not isinstance(source, BaseInputTransport) or not self._is_speaking:
+            return False
+        self._is_speaking = False
+        logger.info("Speech stopped")
+        return True
+
+    def _start_llm_response(
+        self, _frame: LLMFullResponseStartFrame, source: FrameProcessor
+    ) -> bool:
+        # Accumulate the LLM response from the LLM service, logged once it ends
+        if not isinstance(source, LLMService):
+            return False
+        self._llm_accumulator.clear()
+        self._is_accumulating = True
+        return True
+
+    def _accumulate_llm_text(self, frame: LLMTextFrame, source: FrameProcessor) -> bool:
+        # Use LLMTextFrame (not TextFrame) - this is what LLM services output
+        if not isinstance(source, LLMService) or not self._is_accumulating:
+            return False
+        self._llm_accumulator.append(frame.text)
+        return True
+
+    def _log_llm_response(self, _frame: LLMFullResponseEndFrame, source: FrameProcessor) -> bool:
+        if not isinstance(source, LLMService):
+            return False
+        self._is_accumulating = False
+        cleaned_text = "".join(self._llm_accumulator).strip()
+        if cleaned_text:
+            logger.info("Cleaned text: '{}'", cleaned_text)
+        self._llm_accumulator.clear()
+        return True
+
+    def _log_rtvi_server_message(
+        self, frame: RTVIServerMessageFrame, source: FrameProcessor
+    ) -> bool:
+        # Log RTVI server messages when sent from output transport
+        if not isinstance(source, BaseOutputTransport):
+            return False
+        logger.info("Sending to client: {}", frame.data)
+        return True